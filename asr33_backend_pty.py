@@ -14,11 +14,15 @@ Note: This backend only works on Unix-like systems (Linux, macOS).
 
 import os
 import sys
-import select
+import signal
+import selectors
 import threading
-import queue
+import time
 from typing import Any
 
+from asr33_ringbuffer import ByteRing
+from asr33_thread_priority import raise_current_thread_priority
+
 # pty/termios modules are Unix-only
 if sys.platform != "win32":
     import pty
@@ -31,6 +35,18 @@ else:
     struct = None  # type: ignore
     fcntl = None  # type: ignore
 
+# Upper bound for a single PTY read; only limits the maximum returned,
+# so small bursts are still delivered as soon as they arrive
+READ_CHUNK_SIZE = 65536
+
+# Stop draining once this much is batched, so a sustained flood still
+# reaches the upper layer in regular installments
+RECEIVE_BATCH_BYTES = 16384
+
+# Limits for gathering queued send chunks into a single writev
+WRITE_BATCH_BYTES = 4096
+WRITE_BATCH_CHUNKS = 64  # well under IOV_MAX
+
 
 class PtyBackend:
     """PTY backend that spawns a shell for the ASR-33 emulator."""
@@ -50,12 +66,17 @@ class PtyBackend:
             send_queue_size: Size of the send queue.
         """
         self.upper_layer = upper_layer
-        self._send_queue: queue.Queue[bytes] = queue.Queue(send_queue_size)
+        # Outbound chunks; bounded so the tape reader can't run too far ahead
+        self._send_queue = ByteRing(send_queue_size)
         self._running = False
         self._master_fd: int | None = None
         self._pid: int | None = None
         self._rx_thread: threading.Thread | None = None
         self._tx_thread: threading.Thread | None = None
+        # Selector watching the PTY and a self-pipe used to wake the rx thread on close
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
 
         # Use /bin/sh by default for cleaner TTY behavior
         # Modern shells (zsh, bash) have features that don't work well on dumb terminals
@@ -95,6 +116,17 @@ class PtyBackend:
             except (OSError, AttributeError):
                 pass  # Non-fatal if we can't set size
 
+        # Non-blocking so the rx thread can drain everything available per wakeup
+        os.set_blocking(self._master_fd, False)
+
+        # Wait on the PTY and the wakeup pipe (epoll/kqueue where available)
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._master_fd, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+
         # Set up threads to handle I/O
         self._running = True
         self._rx_thread = threading.Thread(target=self._pty_rx_worker, daemon=True)
@@ -104,38 +136,89 @@ class PtyBackend:
 
     def _pty_rx_worker(self) -> None:
         """Background thread: read from PTY and send to upper layer."""
-        while self._running and self._master_fd is not None:
+        raise_current_thread_priority()
+        master_fd = self._master_fd
+        selector = self._selector
+        while self._running and master_fd is not None and selector is not None:
             try:
-                # Use select to wait for data with timeout
-                readable, _, _ = select.select([self._master_fd], [], [], 0.1)
-                if readable:
-                    data = os.read(self._master_fd, 1024)
-                    if data:
+                # Sleep until the PTY has data or close() writes to the wakeup pipe
+                for key, _ in selector.select():
+                    if key.fd == self._wake_r:
+                        os.read(self._wake_r, 64)
+                        continue
+                    # Drain until EAGAIN so a flood costs one select round-trip
+                    chunks = []
+                    size = 0
+                    while size < RECEIVE_BATCH_BYTES:
+                        try:
+                            data = os.read(master_fd, READ_CHUNK_SIZE)
+                        except BlockingIOError:
+                            break
+                        except OSError:
+                            # PTY closed (EIO once the shell has exited)
+                            self._running = False
+                            break
+                        if not data:
+                            # EOF - shell exited
+                            self._running = False
+                            break
+                        chunks.append(data)
+                        size += len(data)
+                    if chunks:
                         if self.upper_layer and hasattr(self.upper_layer, 'receive_data'):
-                            self.upper_layer.receive_data(data)
-                    else:
-                        # EOF - shell exited
-                        self._running = False
-                        break
+                            self.upper_layer.receive_data(b"".join(chunks))
             except OSError:
                 # PTY closed
                 self._running = False
                 break
 
+        # Release the tx thread and any blocked sender
+        self._send_queue.close()
+
     def _pty_tx_worker(self) -> None:
         """Background thread: write to PTY from send queue."""
         while self._running and self._master_fd is not None:
+            data = self._send_queue.get()
+            if data is None:
+                continue  # Closed; loop condition ends the thread
+            chunks: list[bytes | memoryview] = [data]
+            size = len(data)
+            # Gather queued chunks so a burst costs one writev, without concatenating
+            while size < WRITE_BATCH_BYTES and len(chunks) < WRITE_BATCH_CHUNKS:
+                data = self._send_queue.get_nowait()
+                if data is None:
+                    break
+                chunks.append(data)
+                size += len(data)
             try:
-                data = self._send_queue.get(timeout=0.1)
-                if data and self._master_fd is not None:
-                    os.write(self._master_fd, data)
-            except queue.Empty:
-                continue
+                while chunks and self._running and self._master_fd is not None:
+                    try:
+                        written = os.writev(self._master_fd, chunks)
+                    except BlockingIOError:
+                        # PTY input buffer full; wait until the shell reads some
+                        self._wait_writable(self._master_fd)
+                        continue
+                    # Drop fully written chunks; resume a partial one where it stopped
+                    while written:
+                        if written >= len(chunks[0]):
+                            written -= len(chunks.pop(0))
+                        else:
+                            chunks[0] = memoryview(chunks[0])[written:]
+                            written = 0
             except OSError:
                 # PTY closed
                 self._running = False
                 break
 
+        # Release any sender blocked on a full queue
+        self._send_queue.close()
+
+    def _wait_writable(self, fd: int) -> None:
+        """Wait briefly for fd to accept more data (bounded so close() isn't held up)."""
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_WRITE)
+            selector.select(timeout=0.1)
+
     def send_data(self, data: bytes) -> None:
         """Queue data to be sent to the PTY."""
         if data and self._running:
@@ -152,6 +235,16 @@ class PtyBackend:
     def close(self) -> None:
         """Close the PTY and stop threads."""
         self._running = False
+        self._send_queue.close()
+
+        # Wake the rx thread out of its select and wait for it
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
+        if self._rx_thread is not None:
+            self._rx_thread.join(timeout=1.0)
 
         # Close the master PTY fd
         if self._master_fd is not None:
@@ -161,17 +254,39 @@ class PtyBackend:
                 pass
             self._master_fd = None
 
-        # Wait for threads to finish
-        if self._rx_thread is not None:
-            self._rx_thread.join(timeout=1.0)
         if self._tx_thread is not None:
             self._tx_thread.join(timeout=1.0)
 
+        # Release the selector and wakeup pipe
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wake_r = None
+        self._wake_w = None
+
         # Terminate the child process if still running
         if self._pid is not None and self._pid > 0:
-            try:
-                os.kill(self._pid, 9)
-                os.waitpid(self._pid, 0)
-            except (OSError, ChildProcessError):
-                pass
+            self._reap_child(self._pid)
             self._pid = None
+
+    def _reap_child(self, pid: int) -> None:
+        """Ask the shell to exit, escalating to SIGKILL, without blocking indefinitely."""
+        try:
+            # SIGHUP is what a shell expects when its terminal goes away;
+            # interactive shells ignore SIGTERM.
+            os.kill(pid, signal.SIGHUP)
+            for _ in range(50):
+                reaped, _ = os.waitpid(pid, os.WNOHANG)
+                if reaped:
+                    return
+                time.sleep(0.01)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except (OSError, ChildProcessError):
+            pass
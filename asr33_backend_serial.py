@@ -12,9 +12,13 @@ Serial port backend for ASR-33 emulator.
 import sys
 import threading
 import time
-import queue
 from typing import Any
-import serial
+
+from asr33_ringbuffer import ByteRing
+from asr33_thread_priority import raise_current_thread_priority
+
+# Upper bound on bytes gathered before handing a batch to the upper layer
+RECEIVE_BATCH_BYTES = 16384
 
 class SerialBackend:
     """Serial port backend for ASR-33 emulator."""
@@ -36,6 +40,9 @@ class SerialBackend:
             stopbits: Stop bits (serial.STOPBITS_ONE, STOPBITS_ONE_POINT_FIVE, STOPBITS_TWO).
             timeout: Read timeout in seconds.
         """
+        # Imported here so other backends don't pay for loading pyserial
+        import serial  # pylint: disable=import-outside-toplevel
+
         self.upper_layer = upper_layer
         self.ser = serial.Serial(
             port=config.get("port", default="COM4"),
@@ -43,12 +50,12 @@ class SerialBackend:
             bytesize=config.get("databits", default=serial.EIGHTBITS),
             parity=config.get("parity", default=serial.PARITY_NONE),
             stopbits=config.get("stopbits", default=serial.STOPBITS_ONE),
-            timeout=0
+            timeout=0.1  # rx thread blocks in read() until data arrives or timeout
         )
         # set_buffer_size is not supported by pyserial on Linux
         if sys.platform.startswith("win"):
             self.ser.set_buffer_size(rx_size=8, tx_size=4096)
-        self._send_queue = queue.Queue(send_queue_size)
+        self._send_queue = ByteRing(send_queue_size)
 
         self._running = True
         self._rx_thread = threading.Thread(target=self._serial_rx_worker, daemon=True)
@@ -59,28 +66,39 @@ class SerialBackend:
 
     def _serial_rx_worker(self) -> None:
         """Background thread: read from serial port and send to upper layer."""
+        raise_current_thread_priority()
         while self._running:
+            # Block until at least one byte arrives (or the read timeout expires),
+            # then drain whatever else is already buffered into the same batch.
+            data = self.ser.read(max(1, self.ser.in_waiting))
+            if not data:
+                continue
+            while len(data) < RECEIVE_BATCH_BYTES:
+                waiting = self.ser.in_waiting
+                if not waiting:
+                    break
+                data += self.ser.read(waiting)
             # At startup, upper_layer may not be set yet
-            if self.ser.in_waiting:
-                if self.upper_layer is None or not hasattr(self.upper_layer, 'receive_data'):
-                    time.sleep(0.100)
-                    continue
-                data = self.ser.read(self.ser.in_waiting)
-                if data:
-                    self.upper_layer.receive_data(data)
-                    time.sleep(0.005)  # smaller delay when data is received
-                    continue
-            time.sleep(0.050)  # Larger delay when idle
+            while self._running and (
+                self.upper_layer is None or not hasattr(self.upper_layer, 'receive_data')
+            ):
+                time.sleep(0.100)
+            if self._running:
+                self.upper_layer.receive_data(data)
 
     def _serial_tx_worker(self) -> None:
         """Background thread: write to serial port from send queue."""
         while self._running:
-            if not self._send_queue.empty():
-                data = self._send_queue.get()
-                self.ser.write(data)
-                time.sleep(0.005)  # smaller delay after sending data
-                continue
-            time.sleep(0.050)  # Larger delay when idle
+            # Sleeps on the ring's event until send_data() queues something
+            data = self._send_queue.get()
+            if data is None:
+                continue  # Closed; loop condition ends the thread
+            # Coalesce anything queued behind it into a single write
+            chunks = self._send_queue.drain()
+            if chunks:
+                chunks.insert(0, data)
+                data = b"".join(chunks)
+            self.ser.write(data)
 
     def send_data(self, data: bytes) -> None:
         """Queues data received from upper layer to be sent to the lower layer."""
@@ -97,6 +115,10 @@ class SerialBackend:
     def close(self) -> None:
         """Close the serial port and stop the backend thread."""
         self._running = False
+        self._send_queue.close()
+        # Unblock a pending read() so the rx thread sees _running promptly
+        if hasattr(self.ser, "cancel_read"):
+            self.ser.cancel_read()
         self._tx_thread.join()
         self._rx_thread.join()
         if self.ser.is_open:
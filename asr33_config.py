@@ -4,46 +4,90 @@ Handles configuration from YAML files and command-line arguments.
 CLI arguments always override config file settings.
 """
 
-import argparse
+import copy
+import functools
+import hashlib
+import importlib.util
+import operator
 import os
+import pickle
 import sys
+import time
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
-import yaml
+# argparse, yaml and serial.tools.list_ports are imported on first use, so
+# importing this module doesn't pay for them unless help or an argument
+# error is shown, a config file is read or ports are scanned.
+if TYPE_CHECKING:
+    import argparse
 
-# Optional serial port enumeration
-try:
-    import serial.tools.list_ports
-    HAS_SERIAL = True
-except ImportError:
-    HAS_SERIAL = False
+# Optional serial port enumeration. A "serial" package that isn't pyserial, or
+# a broken install, is only found out when the scan imports it; HAS_SERIAL is
+# cleared then and callers fall back to "no ports / assume valid".
+HAS_SERIAL = importlib.util.find_spec("serial") is not None
 
 
 # --- Configuration file locations ---
 
-def _get_platform_config_dir() -> Path:
-    """Return the platform-appropriate user config directory."""
-    if sys.platform == "win32":
+def _platform_config_dir(platform: str, env: Mapping[str, str], home: Path | None = None) -> Path:
+    """
+    Return the user config directory for the given platform and environment.
+
+    home defaults to Path.home(), looked up only if the environment doesn't
+    name a directory.
+    """
+    if platform == "win32":
         # Windows: use APPDATA (roaming) or LOCALAPPDATA
-        appdata = os.environ.get("APPDATA")
+        appdata = env.get("APPDATA")
         if appdata:
             return Path(appdata) / "asr33emu"
-        localappdata = os.environ.get("LOCALAPPDATA")
+        localappdata = env.get("LOCALAPPDATA")
         if localappdata:
             return Path(localappdata) / "asr33emu"
         # Fallback to home directory
-        return Path.home() / "asr33emu"
+        return (home or Path.home()) / "asr33emu"
     else:
         # Linux/macOS: use XDG_CONFIG_HOME or ~/.config
-        xdg_config = os.environ.get("XDG_CONFIG_HOME")
+        xdg_config = env.get("XDG_CONFIG_HOME")
         if xdg_config:
             return Path(xdg_config) / "asr33emu"
-        return Path.home() / ".config" / "asr33emu"
+        return (home or Path.home()) / ".config" / "asr33emu"
+
+
+@functools.cache
+def _get_platform_config_dir() -> Path:
+    """Return the platform-appropriate user config directory."""
+    return _platform_config_dir(sys.platform, os.environ)
+
+
+@functools.cache
+def _get_platform_cache_dir() -> Path:
+    """Return the platform-appropriate user cache directory."""
+    if sys.platform == "win32":
+        # Windows: caches belong in LOCALAPPDATA (not roamed)
+        localappdata = os.environ.get("LOCALAPPDATA")
+        if localappdata:
+            return Path(localappdata) / "asr33emu" / "cache"
+        return Path.home() / "asr33emu" / "cache"
+    else:
+        # Linux/macOS: use XDG_CACHE_HOME or ~/.cache
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        if xdg_cache:
+            return Path(xdg_cache) / "asr33emu"
+        return Path.home() / ".cache" / "asr33emu"
 
 
 def get_default_config_paths() -> list[Path]:
     """Return list of config file paths to search, in priority order."""
+    return list(_default_config_paths())
+
+
+@functools.cache
+def _default_config_paths() -> tuple[Path, ...]:
+    """Build the config search paths once; see get_default_config_paths()."""
     paths = []
 
     # 1. Current directory (highest priority)
@@ -55,7 +99,81 @@ def get_default_config_paths() -> list[Path]:
     # 3. Home directory dotfile (works on all platforms)
     paths.append(Path.home() / ".asr33emu.yaml")
 
-    return paths
+    return tuple(paths)
+
+
+def _reset_config_path_cache() -> None:
+    """Forget cached config locations (e.g. after the environment changes)."""
+    _get_platform_config_dir.cache_clear()
+    _get_platform_cache_dir.cache_clear()
+    _default_config_paths.cache_clear()
+
+
+def _import_yaml():
+    """
+    Import yaml on first use.
+
+    Returns (yaml, SafeLoader, SafeDumper), preferring the libyaml-backed
+    CSafeLoader/CSafeDumper when PyYAML was built with them.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _load_config_cached(path: Path) -> dict:
+    """
+    Parse a YAML config file, reusing earlier parses where possible.
+
+    Results are memoized in-process by (absolute path, mtime), and also
+    pickled in the user cache dir: one file per config path, holding the
+    mtime it was parsed at, so editing the file invalidates both and the
+    next parse overwrites the stale pickle. Any problem with the on-disk
+    cache just falls back to parsing the YAML.
+
+    The returned dict may be shared between callers; treat it as read-only.
+    """
+    path = path.resolve()
+    return _parse_config_file(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path_str: str, mtime_ns: int) -> dict:
+    """Load one version of a config file; see _load_config_cached()."""
+    path = Path(path_str)
+    key = hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()
+    cache_path = _get_platform_cache_dir() / f"{key}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_mtime_ns, data = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            return data
+    except Exception:  # pylint: disable=broad-exception-caught
+        # A corrupt pickle can raise almost anything; the YAML is always the fallback
+        pass
+
+    yaml, safe_loader, _ = _import_yaml()
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=safe_loader) or {}
+
+    # Write atomically so a concurrent start never sees a partial pickle;
+    # this replaces the entry for any earlier version of the file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((mtime_ns, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort, but don't leave a partial temp file behind
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+    return data
 
 
 def get_user_config_path() -> Path:
@@ -73,19 +191,48 @@ def find_config_file() -> Path | None:
 
 # --- Serial port utilities ---
 
+# Port enumeration can be slow (e.g. WMI on Windows), so scans are cached briefly
+PORT_CACHE_TTL_SECONDS = 2.0
+_port_cache: tuple[float, list[dict[str, str]], frozenset[str]] | None = None
+
+
+def invalidate_port_cache() -> None:
+    """Discard cached serial port scan results."""
+    global _port_cache
+    _port_cache = None
+
+
+def _scan_serial_ports() -> tuple[float, list[dict[str, str]], frozenset[str]] | None:
+    """
+    Return (timestamp, ports, device names), rescanning if the cache is stale.
+    Returns None if pyserial's port listing can't be imported.
+    """
+    global _port_cache, HAS_SERIAL
+    now = time.monotonic()
+    if _port_cache is None or now - _port_cache[0] >= PORT_CACHE_TTL_SECONDS:
+        try:
+            import serial.tools.list_ports  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            HAS_SERIAL = False
+            return None
+        ports = []
+        for port in serial.tools.list_ports.comports():
+            ports.append({
+                "device": port.device,
+                "description": port.description,
+                "hwid": port.hwid,
+            })
+        _port_cache = (now, ports, frozenset(p["device"] for p in ports))
+    return _port_cache
+
+
 def list_serial_ports() -> list[dict[str, str]]:
     """Return list of available serial ports with descriptions."""
-    if not HAS_SERIAL:
+    scan = _scan_serial_ports() if HAS_SERIAL else None
+    if scan is None:
         return []
 
-    ports = []
-    for port in serial.tools.list_ports.comports():
-        ports.append({
-            "device": port.device,
-            "description": port.description,
-            "hwid": port.hwid,
-        })
-    return ports
+    return [dict(port) for port in scan[1]]
 
 
 def print_available_ports(file=None) -> None:
@@ -109,51 +256,93 @@ def print_available_ports(file=None) -> None:
 
 def is_valid_port(port: str) -> bool:
     """Check if a port exists in the list of available ports."""
-    if not HAS_SERIAL:
+    scan = _scan_serial_ports() if HAS_SERIAL else None
+    if scan is None:
         return True  # Can't check, assume valid
 
-    available = [p["device"] for p in list_serial_ports()]
-    return port in available
+    return port in scan[2]
 
 
 # --- Config node wrapper ---
 
-class ConfigNode:
+class ConfigNode(SimpleNamespace):
     """
     Lightweight wrapper that allows attribute-style access to dictionaries.
     Example:
         config.sound.config.lid.upper()
+
+    The dictionary is converted once, at construction, into nested
+    namespaces, so attribute access is a plain instance lookup with no
+    per-access wrapping. get() and to_dict() work off the original data.
     """
+    # The namespace __dict__ holds only config keys; the source data sits in a slot
+    __slots__ = ("_data",)
+
     def __init__(self, data):
+        children = {}
+        if isinstance(data, Mapping):
+            for key, value in data.items():
+                # Keys that would shadow methods or slots stay reachable through get()
+                if isinstance(key, str) and not hasattr(ConfigNode, key):
+                    # Wrap nested dicts so chaining continues
+                    children[key] = ConfigNode(value) if isinstance(value, Mapping) else value
+        super().__init__(**children)
         self._data = data
 
     def __getattr__(self, key: str) -> Any:
-        if isinstance(self._data, dict) and key in self._data:
-            value = self._data[key]
-            # Wrap nested dicts so chaining continues
-            return ConfigNode(value) if isinstance(value, dict) else value
+        # Only reached when the key was not found in the prebuilt tree
         raise AttributeError(f"No such config key: {key}")
 
+    def __getitem__(self, key: str) -> Any:
+        """Item-style access to the same prebuilt children: config["sound"]["config"]."""
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            # Keys that couldn't become attributes (e.g. "get"); KeyError if truly missing
+            value = self._data[key]
+            return ConfigNode(value) if isinstance(value, Mapping) else value
+
     def get(self, *keys, default=None):
         """
         Optional nested getter: config.get("sound", "config", "lid")
+
+        Sections come back as Mappings that may be read-only (the
+        defaults are frozen); use to_dict() for a copy you can modify.
         """
         current = self._data
         for key in keys:
-            if isinstance(current, dict) and key in current:
+            if isinstance(current, Mapping) and key in current:
                 current = current[key]
             else:
                 return default
         return current
 
     def to_dict(self) -> dict:
-        """Return the underlying dictionary."""
-        return self._data
+        """Return a mutable deep copy of the underlying dictionary."""
+        return _copy_tree(self._data)
 
 
 # --- Default configuration ---
 
-DEFAULT_CONFIG = {
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _copy_tree(value: Any) -> Any:
+    """Deep-copy a config tree into plain, mutable dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return copy.deepcopy(value)
+
+
+# Read-only, so it can be shared without a defensive copy; deep_merge()
+# produces mutable copies whenever something is layered on top.
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze({
     "frontend": {
         "type": "tkinter",
     },
@@ -229,20 +418,224 @@ DEFAULT_CONFIG = {
             "ascii_char_mask_msb": True,
         }
     },
-}
+})
 
 
-def deep_merge(base: dict, overlay: dict) -> dict:
-    """Deep merge overlay into base, returning a new dict."""
-    result = base.copy()
-    for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+def deep_merge(base: Mapping, overlay: Mapping) -> dict:
+    """Deep merge overlay into base, returning a new dict.
+
+    Neither argument is modified and the result shares no nested dicts
+    with either of them. Read-only mappings (e.g. DEFAULT_CONFIG) come
+    back as plain dicts.
+    """
+    result = _copy_tree(base)
+    # Walk matching subtrees iteratively, merging in place into the copy
+    stack = [(result, overlay)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, Mapping) and isinstance(dst.get(key), dict):
+                stack.append((dst[key], value))
+            else:
+                dst[key] = _copy_tree(value)
     return result
 
 
+# --- Command-line arguments ---
+
+_EPILOG = """
+Examples:
+  %(prog)s --list-ports
+  %(prog)s --port /dev/cu.usbserial-A50285BI
+  %(prog)s --port COM3 --baud 110 --save
+  %(prog)s --port pty                         # local shell (Unix/macOS)
+  %(prog)s --port none                        # local loopback
+  %(prog)s --backend ssh --config my_config.yaml
+
+On Linux the serial and pty receive threads and the sound thread request
+SCHED_FIFO priority to keep print timing and sound steady. This needs CAP_SYS_NICE, e.g.:
+  sudo setcap cap_sys_nice+ep "$(readlink -f "$(which python3)")"
+Without it they fall back to normal priority.
+"""
+
+# (flags, add_argument kwargs). Read directly by _parse_simple_args(), and
+# only handed to argparse for --help or when the command line needs an error.
+_ARGUMENTS: list[tuple[tuple[str, ...], dict[str, Any]]] = [
+    # Config file
+    (("--config", "-c"), dict(
+        type=str, metavar="FILE",
+        help="Path to YAML config file"
+    )),
+    (("--save", "-s"), dict(
+        action="store_true",
+        help="Save current settings to user config file"
+    )),
+
+    # Port management
+    (("--list-ports", "-l"), dict(
+        action="store_true",
+        help="List available serial ports and exit"
+    )),
+    (("--port", "-p"), dict(
+        type=str, metavar="DEVICE",
+        help="Serial port (e.g., COM3, /dev/ttyUSB0), 'pty' for local shell (Unix/macOS only), or 'none' for loopback"
+    )),
+
+    # Frontend/backend selection
+    (("--frontend", "-f"), dict(
+        choices=["pygame", "tkinter"],
+        help="Frontend type"
+    )),
+    (("--backend", "-b"), dict(
+        choices=["serial", "ssh"],
+        help="Backend type"
+    )),
+
+    # Terminal settings
+    (("--term_mode",), dict(
+        choices=["line", "local"],
+        help="Terminal mode: line or local (loopback)"
+    )),
+    (("--columns",), dict(
+        type=int, metavar="N",
+        help="Number of terminal columns"
+    )),
+    (("--rows",), dict(
+        type=int, metavar="N",
+        help="Number of terminal rows"
+    )),
+    (("--scrollback",), dict(
+        type=int, metavar="N",
+        help="Number of scrollback lines"
+    )),
+
+    # Serial settings
+    (("--baud", "--baudrate"), dict(
+        type=int, metavar="RATE",
+        help="Serial baud rate (e.g., 110, 9600, 19200)"
+    )),
+    (("--databits",), dict(
+        type=int, choices=[5, 6, 7, 8],
+        help="Serial data bits"
+    )),
+    (("--parity",), dict(
+        choices=["N", "E", "O", "M", "S"],
+        help="Serial parity: N=None, E=Even, O=Odd, M=Mark, S=Space"
+    )),
+    (("--stopbits",), dict(
+        type=int, choices=[1, 2],
+        help="Serial stop bits"
+    )),
+
+    # Other settings
+    (("--throttle_rate",), dict(
+        type=int, metavar="CPS",
+        help="Data throttle rate in characters per second"
+    )),
+    (("--mute",), dict(
+        action="store_true",
+        help="Start with sound muted"
+    )),
+]
+
+def _argument_dest(flags: tuple[str, ...], kwargs: dict[str, Any]) -> str:
+    """Return the Namespace attribute argparse would use for an argument."""
+    if "dest" in kwargs:
+        return kwargs["dest"]
+    long_flag = next(flag for flag in flags if flag.startswith("--"))
+    return long_flag[2:].replace("-", "_")
+
+
+def _argument_default(kwargs: dict[str, Any]) -> Any:
+    """Return the value argparse would use for an argument that wasn't given."""
+    if "default" in kwargs:
+        return kwargs["default"]
+    return False if kwargs.get("action") == "store_true" else None
+
+
+# Every flag spelling -> (Namespace attribute, add_argument kwargs)
+_FLAG_SPECS: dict[str, tuple[str, dict[str, Any]]] = {
+    flag: (_argument_dest(flags, kwargs), kwargs)
+    for flags, kwargs in _ARGUMENTS
+    for flag in flags
+}
+
+
+def _parse_simple_args(argv: Sequence[str]) -> SimpleNamespace | None:
+    """Parse plain, well-formed command lines without argparse.
+
+    Accepts "--flag value", "-f value" and "--flag=value" for the flags in
+    _ARGUMENTS, converting and checking values as argparse would. Returns
+    None for anything else (--help, unknown or abbreviated flags, missing
+    or invalid values) so the caller can let argparse print help or errors.
+    """
+    values = {_argument_dest(flags, kwargs): _argument_default(kwargs) for flags, kwargs in _ARGUMENTS}
+    args = iter(argv)
+    for arg in args:
+        flag, has_value, value = arg.partition("=")
+        spec = _FLAG_SPECS.get(flag)
+        if spec is None or (has_value and not flag.startswith("--")):
+            return None
+        dest, kwargs = spec
+        if kwargs.get("action") == "store_true":
+            if has_value:
+                return None
+            values[dest] = True
+            continue
+        if not has_value:
+            value = next(args, None)
+            if value is None or value.startswith("-"):
+                return None
+        try:
+            value = kwargs.get("type", str)(value)
+        except ValueError:
+            return None
+        if "choices" in kwargs and value not in kwargs["choices"]:
+            return None
+        values[dest] = value
+    return SimpleNamespace(**values)
+
+
+@functools.cache
+def _build_parser(description: str) -> "argparse.ArgumentParser":
+    """
+    Build the full argparse parser for the arguments in _ARGUMENTS.
+
+    The parser is built once per description and shared; parse_args()
+    doesn't modify it.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel, redefined-outer-name
+
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+    for flags, kwargs in _ARGUMENTS:
+        parser.add_argument(*flags, **kwargs)
+    return parser
+
+
+# CLI argument -> config path(s) it overrides. Built once at import;
+# multi-target args (one CLI arg sets several config values) list each path.
+_CLI_OVERRIDES: tuple[tuple[str, tuple[tuple[str, ...], ...]], ...] = (
+    ("frontend", (("frontend", "type"),)),
+    ("backend", (("backend", "type"),)),
+    ("baud", (("backend", "serial_config", "baudrate"),)),
+    ("databits", (("backend", "serial_config", "databits"),)),
+    ("parity", (("backend", "serial_config", "parity"),)),
+    ("stopbits", (("backend", "serial_config", "stopbits"),)),
+    ("term_mode", (("terminal", "config", "mode"),)),
+    ("columns", (("terminal", "config", "columns"),)),
+    ("rows", (("terminal", "config", "rows"),)),
+    ("scrollback", (("terminal", "config", "scrollback"),)),
+    ("throttle_rate", (
+        ("data_throttle", "config", "send_rate_cps"),
+        ("data_throttle", "config", "receive_rate_cps"),
+    )),
+)
+
+
 # --- Main config class ---
 
 class ASR33Config:
@@ -251,11 +644,12 @@ class ASR33Config:
     def __init__(self, description: str = "ASR-33 Teletype Emulator"):
         self.args = self._parse_args(description)
         self.config_path = None
-        self._raw_config = {}
-        self._merged_config = {}
+        self._raw_config: Mapping[str, Any] = {}
+        self._merged_config: Mapping[str, Any] = {}
 
         # Handle --list-ports early exit
         if self.args.list_ports:
+            invalidate_port_cache()
             print_available_ports()
             sys.exit(0)
 
@@ -273,104 +667,22 @@ class ASR33Config:
         self.config = ConfigNode(self._raw_config)
         self.merged_config = ConfigNode(self._merged_config)
 
-    def _parse_args(self, description: str) -> argparse.Namespace:
+    def _parse_args(self, description: str) -> "SimpleNamespace | argparse.Namespace":
         """Parse command-line arguments."""
-        parser = argparse.ArgumentParser(
-            description=description,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  %(prog)s --list-ports
-  %(prog)s --port /dev/cu.usbserial-A50285BI
-  %(prog)s --port COM3 --baud 110 --save
-  %(prog)s --port pty                         # local shell (Unix/macOS)
-  %(prog)s --port none                        # local loopback
-  %(prog)s --backend ssh --config my_config.yaml
-"""
-        )
-
-        # Config file
-        parser.add_argument(
-            "--config", "-c", type=str, metavar="FILE",
-            help="Path to YAML config file"
-        )
-        parser.add_argument(
-            "--save", "-s", action="store_true",
-            help="Save current settings to user config file"
-        )
-
-        # Port management
-        parser.add_argument(
-            "--list-ports", "-l", action="store_true",
-            help="List available serial ports and exit"
-        )
-        parser.add_argument(
-            "--port", "-p", type=str, metavar="DEVICE",
-            help="Serial port (e.g., COM3, /dev/ttyUSB0), 'pty' for local shell (Unix/macOS only), or 'none' for loopback"
-        )
-
-        # Frontend/backend selection
-        parser.add_argument(
-            "--frontend", "-f", choices=["pygame", "tkinter"],
-            help="Frontend type"
-        )
-        parser.add_argument(
-            "--backend", "-b", choices=["serial", "ssh"],
-            help="Backend type"
-        )
-
-        # Terminal settings
-        parser.add_argument(
-            "--term_mode", choices=["line", "local"],
-            help="Terminal mode: line or local (loopback)"
-        )
-        parser.add_argument(
-            "--columns", type=int, metavar="N",
-            help="Number of terminal columns"
-        )
-        parser.add_argument(
-            "--rows", type=int, metavar="N",
-            help="Number of terminal rows"
-        )
-        parser.add_argument(
-            "--scrollback", type=int, metavar="N",
-            help="Number of scrollback lines"
-        )
-
-        # Serial settings
-        parser.add_argument(
-            "--baud", "--baudrate", type=int, metavar="RATE",
-            help="Serial baud rate (e.g., 110, 9600, 19200)"
-        )
-        parser.add_argument(
-            "--databits", type=int, choices=[5, 6, 7, 8],
-            help="Serial data bits"
-        )
-        parser.add_argument(
-            "--parity", choices=["N", "E", "O", "M", "S"],
-            help="Serial parity: N=None, E=Even, O=Odd, M=Mark, S=Space"
-        )
-        parser.add_argument(
-            "--stopbits", type=int, choices=[1, 2],
-            help="Serial stop bits"
-        )
-
-        # Other settings
-        parser.add_argument(
-            "--throttle_rate", type=int, metavar="CPS",
-            help="Data throttle rate in characters per second"
-        )
-        parser.add_argument(
-            "--mute", action="store_true",
-            help="Start with sound muted"
-        )
-
-        return parser.parse_args()
+        argv = sys.argv[1:]
+
+        # Ordinary command lines never need argparse
+        args = _parse_simple_args(argv)
+        if args is not None:
+            return args
+
+        # --help, or a command line argparse should report an error for
+        return _build_parser(description).parse_args(argv)
 
     def _load_config(self) -> None:
         """Load configuration from file."""
-        # Start with defaults
-        self._raw_config = deep_merge({}, DEFAULT_CONFIG)
+        # Start with the (read-only) defaults; only copied if a file overlays them
+        self._raw_config = DEFAULT_CONFIG
 
         # Find config file
         if self.args.config:
@@ -385,55 +697,35 @@ Examples:
 
         # Load and merge config file if found
         if self.config_path and self.config_path.exists():
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                file_config = yaml.safe_load(f) or {}
+            file_config = _load_config_cached(self.config_path)
             self._raw_config = deep_merge(self._raw_config, file_config)
 
-    def _merge_with_args(self, config: dict) -> dict:
-        """Merge command-line arguments over config file settings."""
+    def _merge_with_args(self, config: Mapping) -> Mapping:
+        """Merge command-line arguments over config file settings.
+
+        With no overriding arguments the config is returned as-is (shared,
+        not copied); otherwise a fresh copy is made before it is modified.
+        """
+        port_arg = getattr(self.args, "port", None)
+        if not port_arg and not self.args.mute and all(
+            getattr(self.args, arg_name, None) is None for arg_name, _ in _CLI_OVERRIDES
+        ):
+            return config
+
         merged = deep_merge({}, config)
 
         # Handle special --port values
-        port_arg = getattr(self.args, "port", None)
         if port_arg and port_arg.lower() == "none":
             # Local loopback mode - no backend needed
-            self._set_nested(merged, ["terminal", "config", "mode"], "local")
+            self._set_nested(merged, ("terminal", "config", "mode"), "local")
         elif port_arg and port_arg.lower() in ("pty", "shell"):
             # PTY mode - spawn a shell
-            self._set_nested(merged, ["backend", "type"], "pty")
+            self._set_nested(merged, ("backend", "type"), "pty")
         elif port_arg:
-            self._set_nested(merged, ["backend", "serial_config", "port"], port_arg)
-
-        # CLI argument to config path mappings
-        cli_mappings = {
-            "frontend": ["frontend", "type"],
-            "backend": ["backend", "type"],
-            "baud": ["backend", "serial_config", "baudrate"],
-            "databits": ["backend", "serial_config", "databits"],
-            "parity": ["backend", "serial_config", "parity"],
-            "stopbits": ["backend", "serial_config", "stopbits"],
-            "term_mode": ["terminal", "config", "mode"],
-            "columns": ["terminal", "config", "columns"],
-            "rows": ["terminal", "config", "rows"],
-            "scrollback": ["terminal", "config", "scrollback"],
-        }
-
-        # Multi-target mappings (one CLI arg sets multiple config values)
-        multi_mappings = {
-            "throttle_rate": [
-                ["data_throttle", "config", "send_rate_cps"],
-                ["data_throttle", "config", "receive_rate_cps"],
-            ],
-        }
-
-        # Apply single mappings
-        for arg_name, path in cli_mappings.items():
-            value = getattr(self.args, arg_name, None)
-            if value is not None:
-                self._set_nested(merged, path, value)
+            self._set_nested(merged, ("backend", "serial_config", "port"), port_arg)
 
-        # Apply multi mappings
-        for arg_name, paths in multi_mappings.items():
+        # Apply the precomputed argument -> config path table
+        for arg_name, paths in _CLI_OVERRIDES:
             value = getattr(self.args, arg_name, None)
             if value is not None:
                 for path in paths:
@@ -441,17 +733,20 @@ Examples:
 
         # Boolean flags with fixed values
         if self.args.mute:
-            self._set_nested(merged, ["sound", "config", "mute_state"], "muted")
+            self._set_nested(merged, ("sound", "config", "mute_state"), "muted")
 
         return merged
 
-    def _set_nested(self, d: dict, path: list[str], value: Any) -> None:
+    def _set_nested(self, d: dict, path: Sequence[str], value: Any) -> None:
         """Set a nested dictionary value by path."""
-        for key in path[:-1]:
-            if key not in d:
-                d[key] = {}
-            d = d[key]
-        d[path[-1]] = value
+        try:
+            # Every override path exists in DEFAULT_CONFIG, so this is the usual case
+            parent = functools.reduce(operator.getitem, path[:-1], d)
+        except KeyError:
+            parent = d
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+        parent[path[-1]] = value
 
     def _save_config(self) -> None:
         """Save merged configuration to user config file."""
@@ -461,8 +756,12 @@ Examples:
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write config
+        yaml, _, safe_dumper = _import_yaml()
         with open(save_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(self._merged_config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                _copy_tree(self._merged_config), f,
+                Dumper=safe_dumper, default_flow_style=False, sort_keys=False
+            )
 
         print(f"Configuration saved to: {save_path}")
 
@@ -491,16 +790,16 @@ Examples:
             (is_valid, error_message)
         """
         # Skip validation for non-serial backends (ssh, pty)
-        backend_type = self._merged_config.get("backend", {}).get("type", "serial")
+        backend_type = self.get_key("backend", "type", default="serial")
         if backend_type in ("ssh", "pty"):
             return True, None
 
         # Skip validation for local loopback mode
-        term_mode = self._merged_config.get("terminal", {}).get("config", {}).get("mode", "line")
+        term_mode = self.get_key("terminal", "config", "mode", default="line")
         if term_mode == "local":
             return True, None
 
-        port = self._merged_config.get("backend", {}).get("serial_config", {}).get("port")
+        port = self.get_key("backend", "serial_config", "port")
 
         if not port:
             return False, "No serial port configured"
@@ -512,7 +811,7 @@ Examples:
 
     def print_port_help(self) -> None:
         """Print helpful message about port configuration."""
-        port = self._merged_config.get("backend", {}).get("serial_config", {}).get("port")
+        port = self.get_key("backend", "serial_config", "port")
 
         print("=" * 60, file=sys.stderr)
         if port:
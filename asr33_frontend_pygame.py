@@ -33,8 +33,6 @@ with contextlib.redirect_stdout(io.StringIO()):
 from pygame.locals import KEYDOWN, K_PAGEUP, K_PAGEDOWN, K_HOME, K_END, QUIT, MOUSEBUTTONDOWN
 
 from asr33_config import ASR33Config
-from asr33_backend_ssh import SSHV2Backend
-from asr33_backend_serial import SerialBackend
 from asr33_shim_throttle import DataThrottle
 from asr33_terminal import Terminal
 from asr33_sounds_sm import ASR33AudioModule as ASR33_Sounds
@@ -477,6 +475,16 @@ class ASR33PygameFrontend:
             self.screen.blit(overlay_bg, (bg_rect.left - 5, bg_rect.top - 2))
             self.screen.blit(text_surface, bg_rect)
 
+    def _print_sounds(self, chars: list[str]) -> None:
+        """Play the printing sounds for a run of characters."""
+        if not chars or self._sounds is None:
+            return
+        if hasattr(self._sounds, "print_string"):
+            self._sounds.print_string("".join(chars))
+        elif hasattr(self._sounds, "print_char"):
+            for ch in chars:
+                self._sounds.print_char(ch)
+
     def _main_loop(self):
         """Main loop for Pygame frontend."""
         clock = pygame.time.Clock()
@@ -500,13 +508,17 @@ class ASR33PygameFrontend:
                     self._mouse_scroll(event)
 
             # play sounds for new characters
+            # (sent in batches, split at the column bell to keep the order)
+            printed = []
             while self._term.sound_queue_len() > 0:
                 ch, col = self._term.pop_char_from_sound_queue()
-                if self._sounds is not None and hasattr(self._sounds, "print_char"):
-                    self._sounds.print_char(ch)
+                printed.append(ch)
                 if col == 62:
+                    self._print_sounds(printed)
+                    printed = []
                     if self._sounds is not None and hasattr(self._sounds, "column_bell"):
                         self._sounds.column_bell()
+            self._print_sounds(printed)
 
             if self.display_update_needed:
                 self.display_update_needed = False
@@ -579,7 +591,7 @@ if __name__ == "__main__":
     _config = ASR33Config("ASR-33 Pygame Frontend")
     cfg_data = _config.get_merged_config()
     # Initialize selections as None placeholders first.
-    #pylint: disable=invalid-name
+    #pylint: disable=invalid-name,import-outside-toplevel
     comm_backend_selection = None
     data_throttle = None
     term_selection = None
@@ -588,11 +600,13 @@ if __name__ == "__main__":
     # Comm backend selection: SSHV2 or Serial
     backend_type = cfg_data.backend.get("type", default="serial")
     if backend_type == "ssh":
+        from asr33_backend_ssh import SSHV2Backend
         comm_backend_selection = SSHV2Backend(
             upper_layer=None,
             config=cfg_data.backend.ssh_config
         )
     elif backend_type == "serial": # Serial backend
+        from asr33_backend_serial import SerialBackend
         comm_backend_selection = SerialBackend(
             upper_layer=None,
             config=cfg_data.backend.serial_config
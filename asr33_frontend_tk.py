@@ -22,8 +22,6 @@ from typing import Any, cast
 from fontTools.ttLib import TTFont, TTLibError
 
 from asr33_config import ASR33Config
-from asr33_backend_ssh import SSHV2Backend
-from asr33_backend_serial import SerialBackend
 from asr33_terminal import Terminal
 from asr33_shim_throttle import DataThrottle
 from asr33_sounds_sm import ASR33AudioModule as ASR33_Sounds
@@ -889,6 +887,16 @@ class ASR33TkFrontend:
         else:
             self.status.lower()  # hide
 
+    def _print_sounds(self, chars: list[str]) -> None:
+        """Play the printing sounds for a run of characters."""
+        if not chars or self._sounds is None:
+            return
+        if hasattr(self._sounds, "print_string"):
+            self._sounds.print_string("".join(chars))
+        elif hasattr(self._sounds, "print_char"):
+            for ch in chars:
+                self._sounds.print_char(ch)
+
     def _periodic_tasks(self):
         """Periodic tasks: request data, update display if needed."""
         # Schedule the actual work to run when Tk is idle
@@ -900,13 +908,17 @@ class ASR33TkFrontend:
                     self._update_display()
 
             # play sounds for new characters
+            # (sent in batches, split at the column bell to keep the order)
+            printed = []
             while self._term.sound_queue_len() > 0:
                 ch, col = self._term.pop_char_from_sound_queue()
-                if self._sounds is not None and hasattr(self._sounds, "print_char"):
-                    self._sounds.print_char(ch)
+                printed.append(ch)
                 if col == 62:
+                    self._print_sounds(printed)
+                    printed = []
                     if self._sounds is not None and hasattr(self._sounds, "column_bell"):
                         self._sounds.column_bell()
+            self._print_sounds(printed)
 
             if  self.papertape_reader is not None:
                 for _ in range(50 if self._data_rate == "unthrottled" else 1):
@@ -974,7 +986,7 @@ if __name__ == "__main__":
     _config = ASR33Config("ASR-33 Tkinter Frontend")
     cfg_data = _config.get_merged_config()
     # Initialize selections as None placeholders first.
-    #pylint: disable=invalid-name
+    #pylint: disable=invalid-name,import-outside-toplevel
     comm_backend_selection = None
     data_throttle = None
     term_selection = None
@@ -983,11 +995,13 @@ if __name__ == "__main__":
     # Comm backend selection: SSHV2 or Serial
     backend_type = cfg_data.backend.get("type", default="serial")
     if backend_type == "ssh":
+        from asr33_backend_ssh import SSHV2Backend
         comm_backend_selection = SSHV2Backend(
             upper_layer=None,
             config=cfg_data.backend.ssh_config
         )
     elif backend_type == "serial": # Serial backend
+        from asr33_backend_serial import SerialBackend
         comm_backend_selection = SerialBackend(
             upper_layer=None,
             config=cfg_data.backend.serial_config
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""
+Bounded single-producer/single-consumer ring buffer for ASR-33 emulator backends.
+
+The backends move bytes from exactly one producer thread (the layer above
+calling send_data) to exactly one consumer thread (the backend tx worker).
+For that case a preallocated ring with separate head/tail indices needs no
+lock: each index is only ever written by one side, and under the GIL the
+int updates are atomic. Events are used only to sleep while the ring is
+empty (consumer) or full (producer).
+"""
+
+import threading
+
+
+class ByteRing:
+    """Bounded SPSC ring of byte chunks."""
+
+    def __init__(self, capacity: int = 8):
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Maximum number of queued chunks (rounded up to a power of two).
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._slots: list[bytes | None] = [None] * size
+        self._mask = size - 1
+        self._head = 0  # next slot to read (consumer only)
+        self._tail = 0  # next slot to write (producer only)
+        self._closed = False
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        """Return the number of queued chunks."""
+        return self._tail - self._head
+
+    def put(self, data: bytes) -> bool:
+        """
+        Append a chunk, blocking while the ring is full.
+        Returns False (and drops the chunk) if the ring has been closed.
+        """
+        while self._tail - self._head > self._mask:
+            if self._closed:
+                return False
+            # Clear, then re-check, so a get() racing with us can't be missed
+            self._not_full.clear()
+            if self._tail - self._head > self._mask:
+                self._not_full.wait()
+        if self._closed:
+            return False
+        self._slots[self._tail & self._mask] = data
+        self._tail += 1
+        self._not_empty.set()
+        return True
+
+    def get_nowait(self) -> bytes | None:
+        """Remove and return the oldest chunk, or None if the ring is empty."""
+        if self._head == self._tail:
+            return None
+        index = self._head & self._mask
+        data = self._slots[index]
+        self._slots[index] = None
+        self._head += 1
+        self._not_full.set()
+        return data
+
+    def drain(self) -> list[bytes]:
+        """Remove and return every chunk currently queued (possibly none)."""
+        chunks = []
+        while self._head != self._tail:
+            index = self._head & self._mask
+            chunks.append(self._slots[index])
+            self._slots[index] = None
+            self._head += 1
+        if chunks:
+            self._not_full.set()
+        return chunks
+
+    def get(self, timeout: float | None = None) -> bytes | None:
+        """
+        Remove and return the oldest chunk, blocking while the ring is empty.
+        Returns None on timeout or once the ring has been closed and drained.
+        """
+        if self._head == self._tail:
+            # Clear, then re-check, so a put() racing with us can't be missed
+            self._not_empty.clear()
+            if self._head == self._tail and not self._closed:
+                self._not_empty.wait(timeout)
+        return self.get_nowait()
+
+    def close(self) -> None:
+        """Wake any blocked put() or get() and refuse further data."""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
@@ -2,14 +2,86 @@
 
 """ASR-33 Data Throttle Module"""
 import threading
-import queue
 import time
+from collections import deque
 from typing import Any
 
+# Preallocated one-byte objects, indexed by byte value
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256))
+
+
+class _ChunkQueue:
+    """Bounded FIFO of byte chunks.
+
+    A deque does the storing (append/popleft are atomic under the GIL), and
+    two Events let the consumer sleep while it is empty and the producer
+    block while it is full. Much cheaper per operation than queue.Queue.
+    """
+
+    __slots__ = ("_items", "_maxsize", "_not_empty", "_not_full")
+
+    def __init__(self, maxsize: int):
+        self._items: deque[bytes] = deque()
+        self._maxsize = maxsize
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._not_full.set()
+
+    def put(self, data: bytes) -> None:
+        """Append a chunk, blocking while the queue is full."""
+        while len(self._items) >= self._maxsize:
+            # Clear, then re-check, so a get racing with us can't be missed
+            self._not_full.clear()
+            if len(self._items) >= self._maxsize:
+                self._not_full.wait()
+        self._items.append(data)
+        self._not_empty.set()
+
+    def get_nowait(self) -> bytes | None:
+        """Remove and return the oldest chunk, or None if the queue is empty."""
+        try:
+            data = self._items.popleft()
+        except IndexError:
+            return None
+        self._not_full.set()
+        return data
+
+    def get(self, timeout: float) -> bytes | None:
+        """Remove and return the oldest chunk, waiting up to timeout for one."""
+        if not self._items:
+            # Clear, then re-check, so a put racing with us can't be missed
+            self._not_empty.clear()
+            if not self._items:
+                self._not_empty.wait(timeout)
+        return self.get_nowait()
+
+    def clear(self) -> None:
+        """Discard every queued chunk."""
+        self._items.clear()
+        self._not_full.set()
+
 class DataThrottle:
-    """Controls data rate between serial backend and terminal emulator with optional chunking."""
+    """Controls data rate between serial backend and terminal emulator with optional chunking.
+
+    Each direction has its own worker thread. Delivering a chunk can block
+    (the backend's send queue and this throttle's receive queue are both
+    bounded), so a single shared worker could stall echo behind outgoing
+    data, or deadlock against a PTY whose child is blocked writing output.
+    """
+
+    __slots__ = (
+        "_lower_layer", "_lower_send", "_lower_info",
+        "_upper_layer", "_upper_receive",
+        "_send_rate", "_receive_rate",
+        "_throttling_enabled", "_loopback_enabled", "_lock",
+        "_send_queue", "_receive_queue", "_loopback_queue",
+        "_shutdown", "_tx_thread", "_rx_thread",
+    )
 
     PERCEPTION_THRESHOLD_MS = 20
+    _PERCEPTION_THRESHOLD_S = PERCEPTION_THRESHOLD_MS / 1000.0
+    # Longest a worker blocks waiting for data before re-checking its state
+    IDLE_WAIT_SECONDS = 0.05
 
     def __init__(
             self,
@@ -20,6 +92,11 @@ class DataThrottle:
             receive_queue_size: int = 8  # keep from running too far ahead of terminal
         ):
         self._lower_layer = lower_layer
+        # Resolve the layer methods once rather than probing them per chunk
+        self._lower_send = getattr(lower_layer, 'send_data', None)
+        self._lower_info = getattr(lower_layer, 'get_info_string', None)
+        self._upper_layer = None
+        self._upper_receive = None
         self.upper_layer = upper_layer
         send_rate_cps = config.get("send_rate_cps", default=10)
         receive_rate_cps = config.get("receive_rate_cps", default=10)
@@ -30,18 +107,28 @@ class DataThrottle:
         self._lock = threading.Lock() # Add a lock for thread safety
 
 
-        self._send_queue = queue.Queue(send_queue_size)
-        self._receive_queue = queue.Queue(receive_queue_size)
-        self._loopback_queue = queue.Queue(8)  # Small queue for loopback data
+        self._send_queue = _ChunkQueue(send_queue_size)
+        self._receive_queue = _ChunkQueue(receive_queue_size)
+        self._loopback_queue = _ChunkQueue(8)  # Small queue for loopback data
 
-        self._running = True
+        self._shutdown = threading.Event()
         self._tx_thread = None
         self._rx_thread = None
 
+    @property
+    def upper_layer(self) -> Any:
+        """The layer that receives data from this throttle."""
+        return self._upper_layer
+
+    @upper_layer.setter
+    def upper_layer(self, layer: Any) -> None:
+        self._upper_layer = layer
+        self._upper_receive = getattr(layer, 'receive_data', None)
+
     def get_info_string(self) -> str:
         """Return lower layer info string."""
-        if hasattr(self._lower_layer, 'get_info_string'):
-            return self._lower_layer.get_info_string()
+        if self._lower_info is not None:
+            return self._lower_info()
         return ""
 
     def send_data(self, data: bytes) -> None:
@@ -87,8 +174,7 @@ class DataThrottle:
         """Enables loopback mode."""
         with self._lock:
             # Clear stale data in loopback queue
-            while not self._loopback_queue.empty():
-                self._loopback_queue.get()
+            self._loopback_queue.clear()
             self._loopback_enabled = True
 
     def disable_loopback(self):
@@ -99,52 +185,53 @@ class DataThrottle:
     def _send_data_to_backend(self, data: bytes):
         """Sends data to the lower layer (comm backend)."""
         # Only send if not in loopback mode
-        if self._loopback_enabled:
+        if self._loopback_enabled or self._lower_send is None:
             return
-        self._lower_layer.send_data(data)
+        self._lower_send(data)
 
     def _send_data_to_upper_layer(self, data: bytes):
         """Sends data to the upper layer (terminal emulator)."""
         # Only send if not in loopback mode
-        if self._loopback_enabled:
-            return
-        if self.upper_layer is None or not hasattr(self.upper_layer, 'receive_data'):
+        if self._loopback_enabled or self._upper_receive is None:
             return
-        self.upper_layer.receive_data(data)
+        self._upper_receive(data)
 
     def _send_loopback_to_upper_layer(self, data: bytes):
         """Sends data directly to upper layer in loopback mode.
 
         Translates CR to CR+LF so pressing Return creates a new line.
         """
-        if not self._loopback_enabled:
-            return
-        if self.upper_layer is None or not hasattr(self.upper_layer, 'receive_data'):
+        if not self._loopback_enabled or self._upper_receive is None:
             return
         # Translate CR to CR+LF for proper newline behavior in loopback
-        data = data.replace(b'\r', b'\r\n')
-        self.upper_layer.receive_data(data)
+        if b'\r' in data:
+            data = data.replace(b'\r', b'\r\n')
+        self._upper_receive(data)
 
     def _throttle_tx_worker(self):
         """Manages sending data from the send queue to the serial backend or loopback."""
         last_send_time = time.monotonic()
-        while self._running:
+        while not self._shutdown.is_set():
             # Process data received from upper layer and send to backend
             # The data will be discarded by _send_data_to_backend if loopback is enabled
             last_send_time = self._process_queue_item(
                 self._send_queue,
                 self._send_rate,
                 self._send_data_to_backend,
-                last_send_time
+                last_send_time,
+                block=True
             )
-            time.sleep(0.0033)
 
     def _throttle_rx_worker(self):
         """Manages sending data from the receive queue to the upper layer or loopback."""
         # Initialize separate timestamps for loopback and receive processing
         last_receive_time = time.monotonic()
         last_receive_time_lb = last_receive_time
-        while self._running:
+        while not self._shutdown.is_set():
+            # Only one of the two queues is fed at a time (receive_data drops
+            # data in loopback mode), so block waiting on that one and just
+            # drain whatever is left in the other.
+            loopback = self._loopback_enabled
             # Process loopback data received from upper layer
             # The data will be discarded by _send_loopback_to_upper_layer
             # if loopback is not enabled
@@ -152,7 +239,8 @@ class DataThrottle:
                 self._loopback_queue,
                 self._send_rate,
                 self._send_loopback_to_upper_layer,
-                last_receive_time_lb
+                last_receive_time_lb,
+                block=loopback
             )
             # Send data received from backend and send to upper layer
             # The data will be discarded by _send_data_to_upper_layer
@@ -161,23 +249,27 @@ class DataThrottle:
                 self._receive_queue,
                 self._receive_rate,
                 self._send_data_to_upper_layer,
-                last_receive_time
+                last_receive_time,
+                block=not loopback
             )
-            time.sleep(0.0033)
 
     def _process_queue_item(
             self,
-            q: queue.Queue,
+            q: _ChunkQueue,
             rate: int,
             destination_func,
-            last_event_time: float
+            last_event_time: float,
+            block: bool = False
         ) -> float:
         """Processes the next item in the queue (a chunk of bytes).
            Serializes if throttling is active.
+           If block is set, waits up to IDLE_WAIT_SECONDS for an item.
         """
-        try:
+        if block:
+            chunk = q.get(timeout=self.IDLE_WAIT_SECONDS)
+        else:
             chunk = q.get_nowait()
-        except queue.Empty:
+        if chunk is None:
             return last_event_time
 
         # Check throttling status immediately
@@ -187,38 +279,51 @@ class DataThrottle:
             return time.monotonic()
 
         # Throttling Enabled: Serialize bytes with delays,
-        # respecting a mid-chunk flag change
-        current_time = last_event_time
+        # respecting a mid-chunk flag change.
+        # Bytes that would arrive within one perception threshold of each
+        # other are emitted together as a single group.
+        threshold = DataThrottle._PERCEPTION_THRESHOLD_S
+        monotonic = time.monotonic
+        sleep = time.sleep
         delay_per_char = 1.0 / rate
+        bytes_per_tick = max(1, int(rate * threshold))
+        delay_per_tick = bytes_per_tick * delay_per_char
+        # Time at which the next group is due
+        next_deadline = last_event_time + delay_per_tick
         remaining_chunk = b''
-        for i, byte in enumerate(chunk):
+        for i in range(0, len(chunk), bytes_per_tick):
             # Break immediately if throttling changes to disabled
             if not self._throttling_enabled:
                 # Save the remaining part of the chunk to send instantly below
                 remaining_chunk = chunk[i:]
                 break
 
-            time_since_last_char = time.monotonic() - current_time
+            now = monotonic()
+            if now < next_deadline - threshold:
+                sleep(next_deadline - now)
+            elif now > next_deadline:
+                # Idle or running late: restart the schedule rather than
+                # bursting to catch up
+                next_deadline = now
 
-            if time_since_last_char < delay_per_char:
-                time_to_wait = delay_per_char - time_since_last_char
-                if time_to_wait > (self.PERCEPTION_THRESHOLD_MS / 1000.0):
-                    time.sleep(time_to_wait)
-
-            destination_func(bytes([byte]))
-            current_time = time.monotonic()
+            if bytes_per_tick == 1:
+                destination_func(_SINGLE_BYTES[chunk[i]])
+            else:
+                destination_func(chunk[i:i + bytes_per_tick])
+            next_deadline += delay_per_tick
 
         # If we broke the loop early due to disabling throttling,
         # send the rest instantly (if any)
         if remaining_chunk:
             destination_func(remaining_chunk)
-            return time.monotonic() # Update timestamp to now, as the rest was instant
+            return monotonic() # Update timestamp to now, as the rest was instant
 
-        return current_time # Return the time the *last* byte of the chunk was processed
+        # Return the time the *last* group of the chunk was scheduled
+        return next_deadline - delay_per_tick
 
     def start(self):
         """Starts the management threads."""
-        self._running = True
+        self._shutdown.clear()
         if self._tx_thread is None or not self._tx_thread.is_alive():
             self._tx_thread = threading.Thread(target=self._throttle_tx_worker, daemon=True)
             self._tx_thread.start()
@@ -235,7 +340,7 @@ class DataThrottle:
         if not self._lower_layer is None and hasattr(self._lower_layer, "close"):
             self._lower_layer.close()
 
-        self._running = False
+        self._shutdown.set()
         if self._tx_thread is not None:
             self._tx_thread.join()
         if self._rx_thread is not None:
@@ -7,6 +7,8 @@ import threading
 import time
 import queue
 import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import contextlib
 import io
@@ -14,13 +16,15 @@ import io
 with contextlib.redirect_stdout(io.StringIO()):
     import pygame
 from pygame import mixer
+from asr33_thread_priority import raise_current_thread_priority
 
 # --- Configuration ---
 FADE_DURATION_SECONDS = 0.1          # Fast fade for character switches
 INACTIVITY_TIMEOUT_SECONDS = 0.2     # 200ms timeout to switch to hum
-UPDATE_INTERVAL_SECONDS = 0.050      # State machine update interval
+UPDATE_INTERVAL_SECONDS = 0.050      # State machine update interval while fading
 MUTE_FADE_SECONDS = 0.2              # Fade duration for mute/unmute
 DEFAULT_EFFECT_PLAYTIME_MS = 500     # Default max play time for effects
+VOLUME_EPSILON = 1e-4                # Smallest volume change worth sending to the mixer
 
 MOTOR_ON_PLAY_TIME = 1500
 MOTOR_OFF_PLAY_TIME = 400
@@ -31,32 +35,97 @@ CR_PLAY_TIME = 150
 KEY_PLAY_TIME = 100
 
 MAX_EFFECTS_QUEUE_SIZE = 4  # Max number of pending effect sounds
+MAX_SOUND_LOADERS = 8       # Max threads used to load the sound files
+
+# Open the mixer in the format of the bundled recordings (48 kHz, 16-bit
+# stereo) so SDL loads them as-is instead of resampling each file
+MIXER_FREQUENCY = 48000
+MIXER_SAMPLE_SIZE = -16
+MIXER_CHANNELS = 2
+
+# print_char: (event, playtime_ms) for each 7-bit character code.
+# Control characters, DEL and anything non-ASCII sound as spaces.
+_SPACE_EVENT = ("print-spaces", None)
+_CHAR_EVENTS = [_SPACE_EVENT] * 128
+for _code in range(ord(" ") + 1, ord("~") + 1):
+    _CHAR_EVENTS[_code] = ("print-chars", None)
+_CHAR_EVENTS[ord("\r")] = ("cr", CR_PLAY_TIME)         # carriage return
+_CHAR_EVENTS[ord("\n")] = ("platen", PLATEN_PLAY_TIME) # line feed
+_CHAR_EVENTS[ord("\a")] = ("bell", BELL_PLAY_TIME)     # bell character
+del _code
+
+# Character events that select a continuous sound rather than play an effect
+_CONTINUOUS_EVENTS = frozenset(('print-chars', 'print-spaces'))
+
+# Character events that play a one-shot effect sound
+_EFFECT_EVENTS = frozenset((
+    'key',
+    'bell',
+    'cr',
+    'platen',
+    'motor-on',
+    'motor-off',
+    'lid'
+))
+
+# Target (chars, spaces, hum) volumes for each continuous-sound state
+_TARGET_VOLUMES = {
+    'print-chars': (1.0, 0.0, 0.0),
+    'print-spaces': (0.0, 1.0, 0.0),
+    'hum': (0.0, 0.0, 1.0),
+    'tape-reader': (0.0, 0.0, 0.0),
+}
+
+def _load_sound(entry: Path) -> mixer.Sound | None:
+    """Load one sound file, reporting (rather than raising) any error."""
+    try:
+        return mixer.Sound(str(entry))
+    except pygame.error as e:  # pylint: disable=no-member
+        print(f"Error loading {entry.name}: {e}")
+        return None
+
 
 class TeletypeStateMachine:
     """ASR-33 sound generation state machine using Pygame mixer."""
+
+    __slots__ = (
+        "lock", "event_queue", "effects_queue", "running",
+        "_sounds_dictionary", "_sound_variants",
+        "ch_chars", "ch_spaces", "ch_hum", "ch_tape_reader", "ch_effects", "_channels",
+        "current_state", "last_event_time", "lid_state",
+        "actual_volumes", "target_volumes", "_applied_volumes", "_reapply_volumes", "_dirty",
+        "fade_start_time", "fade_start_volumes",
+        "is_muted", "mute_fade", "_effect_end_time",
+    )
+
+    # Per-channel volumes are kept in lists indexed by these positions
+    IDX_CHARS, IDX_SPACES, IDX_HUM, IDX_TAPE, IDX_EFFECTS = range(5)
+    FADED_CHANNELS = 3  # chars, spaces and hum cross-fade; the others switch instantly
+
     def __init__(self, lock):
         self.lock = lock
-        self.event_queue = queue.Queue()
-        self.effects_queue = queue.Queue()
+        self.event_queue = queue.SimpleQueue()
+        # Only touched by the worker thread, so a plain deque will do
+        self.effects_queue: deque[tuple[mixer.Sound, int]] = deque()
 
-        mixer.init()
+        mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SAMPLE_SIZE, channels=MIXER_CHANNELS)
         mixer.set_num_channels(5)  # 4 continuous + 1 effects channel
 
         self._sounds_dictionary = {}
-        self.effects_key_list = [
-            'key',
-            'bell',
-            'cr',
-            'platen',
-            'motor-on',
-            'motor-off',
-            'lid'
-        ]
+        # "{lid}-{name}" -> the sounds it selects from; filled on first use
+        self._sound_variants: dict[str, list[mixer.Sound]] = {}
         self.ch_chars = mixer.Channel(0)
         self.ch_spaces = mixer.Channel(1)
         self.ch_hum = mixer.Channel(2)
         self.ch_tape_reader = mixer.Channel(3)
         self.ch_effects = mixer.Channel(4)
+        self._channels = [
+            self.ch_chars,
+            self.ch_spaces,
+            self.ch_hum,
+            self.ch_tape_reader,
+            self.ch_effects
+        ]
 
         with self.lock:
             self.ch_chars.set_volume(0.0)
@@ -65,35 +134,27 @@ class TeletypeStateMachine:
             self.ch_tape_reader.set_volume(0.0)
 
         self.current_state = None
-        self.last_event_time = time.time()
-        self.target_volumes = {
-            ch: 0.0 for ch in [
-                self.ch_chars,
-                self.ch_spaces,
-                self.ch_hum,
-                self.ch_tape_reader
-            ]
-        }
+        self.last_event_time = time.monotonic()
+        self.target_volumes = [0.0] * self.FADED_CHANNELS
         self.fade_start_time = None
-        self.fade_start_volumes = None # type: ignore
+        self.fade_start_volumes: list[float] | None = None
 
         self.is_muted = False
-        self.mute_fade_start = None
-        self.mute_fade_from = None
-        self.mute_fade_to = None
+        # (start time, from factor, to factor) of the latest mute fade
+        self.mute_fade: tuple[float, float, float] | None = None
 
         self.lid_state = "up"  # 'up' or 'down'
 
         self.running = True
-        self.actual_volumes = {
-            ch: 0.0 for ch in [
-                self.ch_chars,
-                self.ch_spaces,
-                self.ch_hum,
-                self.ch_tape_reader,
-                self.ch_effects
-            ]
-        }
+        self.actual_volumes = [0.0] * len(self._channels)
+        # When the current effect stops, so the mixer needn't be polled for it
+        self._effect_end_time = 0.0
+        # Set whenever a volume may need changing; cleared once all are settled
+        self._dirty = True
+        # Last volume set on each channel; None forces the next update through.
+        # Worker-only: other threads ask for a full reapply via _reapply_volumes.
+        self._applied_volumes: list[float | None] = [None] * len(self._channels)
+        self._reapply_volumes = False
 
     def start(self) -> None:
         """Starts the state machine."""
@@ -101,11 +162,17 @@ class TeletypeStateMachine:
             self.running = True
             self._build_sounds_dictionary()
             self._start_continuous_sounds()
+        self._wake()
 
     def stop(self) -> None:
         """Stops the state machine."""
         with self.lock:
             self.running = False
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wakes the worker so it acts on a state change made outside the event queue."""
+        self.event_queue.put(None)
 
     def _build_sounds_dictionary(self, sounds_dir: Path | str | None = None) -> None:
         """
@@ -119,17 +186,23 @@ class TeletypeStateMachine:
         else:
             sounds_dir = Path(sounds_dir)
 
+        # Build into new dicts and swap them in, since the worker thread
+        # may be looking sounds up at the same time
+        sounds_dictionary = dict(self._sounds_dictionary)
         try:
-            for entry in sounds_dir.glob("*.wav"):
-                name = entry.stem  # filename without extension
-                try:
-                    self._sounds_dictionary[name] = mixer.Sound(entry)
-                except pygame.error as e:  # pylint: disable=no-member
-                    print(f"Error loading {entry.name}: {e}")
+            entries = list(sounds_dir.glob("*.wav"))
         except FileNotFoundError:
             print(f"ERROR: 'sounds' directory not found at {sounds_dir}")
             return
 
+        # pygame releases the GIL while reading and decoding, so load in parallel
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_SOUND_LOADERS, len(entries)))) as executor:
+            for entry, sound in zip(entries, executor.map(_load_sound, entries)):
+                if sound is not None:
+                    sounds_dictionary[entry.stem] = sound  # filename without extension
+
+        self._sounds_dictionary = sounds_dictionary
+        self._sound_variants = {}
         if not self._sounds_dictionary:
             print("Warning: No sounds loaded. Module running without audio.")
 
@@ -139,14 +212,19 @@ class TeletypeStateMachine:
         """
         prefix = f"{self.lid_state}-{sound_name}"
 
-        # Exact match
-        sound = self._sounds_dictionary.get(prefix)
-        if sound:
-            return sound
+        matches = self._sound_variants.get(prefix)
+        if matches is None:
+            # Exact match, else all the variants sharing the prefix
+            sound = self._sounds_dictionary.get(prefix)
+            if sound:
+                matches = [sound]
+            else:
+                matches = [s for name, s in self._sounds_dictionary.items() if name.startswith(prefix)]
+            self._sound_variants[prefix] = matches
 
-        # Variant matches
-        matches = [s for name, s in self._sounds_dictionary.items() if name.startswith(prefix)]
-        return random.choice(matches) if matches else None
+        if len(matches) > 1:
+            return random.choice(matches)
+        return matches[0] if matches else None
 
     def _start_continuous_sounds(self) -> None:
         """Restart continuous sounds."""
@@ -164,48 +242,35 @@ class TeletypeStateMachine:
             sound = self._get_sound(key)
             if sound is not None:
                 ch.play(sound, loops=-1)
+        # Make sure the next update reapplies every channel volume (this runs
+        # on the caller's thread, so leave _applied_volumes to the worker)
+        self._reapply_volumes = True
+        self._dirty = True
 
-    def _set_volume_targets(self, target_state) -> None:
+    def _set_volume_targets(self, target_state, now: float) -> None:
         """Sets target volumes for the given state and initiates fade."""
-        self.fade_start_time = time.time()
-        self.fade_start_volumes = {
-            ch: self.actual_volumes[ch] for ch in [
-                    self.ch_chars,
-                    self.ch_spaces,
-                    self.ch_hum,
-                    self.ch_tape_reader
-                ]
-        }
-        if target_state == 'print-chars':
-            self.target_volumes[self.ch_chars] = 1.0
-            self.target_volumes[self.ch_spaces] = 0.0
-            self.target_volumes[self.ch_hum] = 0.0
-        elif target_state == 'print-spaces':
-            self.target_volumes[self.ch_chars] = 0.0
-            self.target_volumes[self.ch_spaces] = 1.0
-            self.target_volumes[self.ch_hum] = 0.0
-        elif target_state == 'hum':
-            self.target_volumes[self.ch_chars] = 0.0
-            self.target_volumes[self.ch_spaces] = 0.0
-            self.target_volumes[self.ch_hum] = 1.0
-        elif target_state == 'tape-reader':
-            self.target_volumes[self.ch_chars] = 0.0
-            self.target_volumes[self.ch_spaces] = 0.0
-            self.target_volumes[self.ch_hum] = 0.0
+        self.fade_start_time = now
+        self.fade_start_volumes = self.actual_volumes[:self.FADED_CHANNELS]
+        self._dirty = True
+        targets = _TARGET_VOLUMES.get(target_state)
+        if targets is not None:
+            self.target_volumes[:] = targets
 
     def set_mute_status(self, muted: bool) -> None:
         """Sets mute status with fade."""
         with self.lock:
             if muted != self.is_muted:
-                # record prior state so we can set a sensible fade start value
-                prior_is_muted = self.is_muted
-                # start fade
-                self.mute_fade_start = time.time()
                 # If currently not muted, fade starts from 1.0 -> 0.0 when muting.
                 # If currently muted, fade starts from 0.0 -> 1.0 when unmuting.
-                self.mute_fade_from = 0.0 if prior_is_muted else 1.0
-                self.mute_fade_to = 0.0 if muted else 1.0
+                # Published as one tuple so the worker never sees a partial update.
+                self.mute_fade = (
+                    time.monotonic(),
+                    0.0 if self.is_muted else 1.0,
+                    0.0 if muted else 1.0
+                )
                 self.is_muted = muted
+                self._dirty = True
+        self._wake()
 
     def set_lid_state(self, state: str) -> None:
         """Set the lid state and update sound files accordingly."""
@@ -213,133 +278,198 @@ class TeletypeStateMachine:
             self.lid_state = state # 'up' or 'down'
             # Restart continuous sounds to reflect lid state
             self._start_continuous_sounds()
+        self._wake()
 
     def set_tape_reader_state(self, running: bool) -> None:
         """Turn on or off the tape reader sound."""
         with self.lock:
             if running:
-                self.actual_volumes[self.ch_tape_reader] = 1.0
+                self.actual_volumes[self.IDX_TAPE] = 1.0
             else:
-                self.actual_volumes[self.ch_tape_reader] = 0.0
+                self.actual_volumes[self.IDX_TAPE] = 0.0
+            self._dirty = True
+        self._wake()
 
     def new_character_event(self, char_type, playtime_ms=None):
         """Thread-safe method to push a new character type into the main queue."""
-        with self.lock:
-            self.event_queue.put((char_type, playtime_ms))
+        self.event_queue.put((char_type, playtime_ms))
+
+    def new_character_events(self, events: list[tuple[str, int | None]]) -> None:
+        """Thread-safe method to push a list of (char_type, playtime_ms) events at once."""
+        if events:
+            self.event_queue.put(events)
+
+    # The methods below run only on the audio worker thread, so they need
+    # no locking; the cross-thread setters above take the lock instead.
 
-    def process_event(self, char_type, playtime_ms=None) -> None:
+    def process_event(self, char_type, playtime_ms=None, now: float | None = None) -> None:
         """Processes the next character event and sets new target state/volumes."""
-        with self.lock:
-            self.last_event_time = time.time()
-            if char_type in ['print-chars', 'print-spaces']:
-                if self.current_state != char_type:
-                    self.current_state = char_type
-                    self._set_volume_targets(char_type)
-            elif char_type in self.effects_key_list:
-                sound_obj = self._get_sound(char_type)
-                if playtime_ms is None:
-                    playtime_ms = DEFAULT_EFFECT_PLAYTIME_MS
-                # Limit the effects queue size to MAX_EFFECTS_QUEUE_SIZE
-                # to prevent excessive growth at high data rates.
-                if sound_obj is not None and self.effects_queue.qsize() < MAX_EFFECTS_QUEUE_SIZE:
-                    self.effects_queue.put((sound_obj, playtime_ms))
-                if not self.ch_effects.get_busy() and not self.effects_queue.empty():
-                    self.play_next_effect()
-
-    def check_inactivity(self) :
+        if now is None:
+            now = time.monotonic()
+        self.last_event_time = now
+        if char_type in _CONTINUOUS_EVENTS:
+            if self.current_state != char_type:
+                self.current_state = char_type
+                self._set_volume_targets(char_type, now)
+        elif char_type in _EFFECT_EVENTS:
+            sound_obj = self._get_sound(char_type)
+            if playtime_ms is None:
+                playtime_ms = DEFAULT_EFFECT_PLAYTIME_MS
+            # Limit the effects queue size to MAX_EFFECTS_QUEUE_SIZE
+            # to prevent excessive growth at high data rates.
+            if sound_obj is not None and len(self.effects_queue) < MAX_EFFECTS_QUEUE_SIZE:
+                self.effects_queue.append((sound_obj, playtime_ms))
+            if now >= self._effect_end_time and self.effects_queue:
+                self.play_next_effect(now)
+
+    def next_deadline(self) -> float | None:
+        """Returns how long the worker may wait for the next event,
+           or None if nothing is pending and it can wait indefinitely.
+        """
+        now = time.monotonic()
+        mute_fade = self.mute_fade
+        if (
+            self.fade_start_time is not None or
+            (mute_fade is not None and now - mute_fade[0] < MUTE_FADE_SECONDS)
+        ):
+            # Fading: step the volumes at the update interval
+            return UPDATE_INTERVAL_SECONDS
+        timeout = None
+        if self.actual_volumes[self.IDX_EFFECTS] != 0.0 or self.effects_queue:
+            # An effect is playing or waiting; wake when the current one ends
+            timeout = max(0.0, self._effect_end_time - now)
+        if self.current_state != 'hum':
+            elapsed = now - self.last_event_time
+            inactivity = max(0.0, INACTIVITY_TIMEOUT_SECONDS - elapsed)
+            timeout = inactivity if timeout is None else min(timeout, inactivity)
+        return timeout
+
+    def check_inactivity(self, now: float | None = None) :
         """Checks for inactivity and switches to hum state if needed."""
-        with self.lock:
-            if self.current_state != 'hum':
-                elapsed = time.time() - self.last_event_time
-                if elapsed >= INACTIVITY_TIMEOUT_SECONDS:
-                    self.current_state = 'hum'
-                    self._set_volume_targets('hum')
-
-    def play_next_effect(self) -> None:
+        if self.current_state != 'hum':
+            if now is None:
+                now = time.monotonic()
+            elapsed = now - self.last_event_time
+            if elapsed >= INACTIVITY_TIMEOUT_SECONDS:
+                self.current_state = 'hum'
+                self._set_volume_targets('hum', now)
+
+    def play_next_effect(self, now: float | None = None) -> None:
         """Plays the next effect sound from the effects queue."""
-        if not self.effects_queue.empty():
-            sound_obj, playtime_ms = self.effects_queue.get()
+        if self.effects_queue:
+            sound_obj, playtime_ms = self.effects_queue.popleft()
             if sound_obj is not None:
+                if now is None:
+                    now = time.monotonic()
                 self.ch_effects.play(sound_obj, maxtime=playtime_ms)
-                self.actual_volumes[self.ch_effects] = 1.0
+                self._effect_end_time = now + min(playtime_ms / 1000.0, sound_obj.get_length())
+                self.actual_volumes[self.IDX_EFFECTS] = 1.0
+                self._applied_volumes[self.IDX_EFFECTS] = None
+                self._dirty = True
 
-    def update_volumes(self) -> None:
+    def update_volumes(self, now: float | None = None) -> None:
         """Updates the actual volumes towards target volumes with fading."""
-        with self.lock:
-            if self.fade_start_time is not None:
-                elapsed = time.time() - self.fade_start_time
-                if elapsed >= FADE_DURATION_SECONDS:
-                    for ch in [self.ch_chars, self.ch_spaces, self.ch_hum]:
-                        # Use target volumes if fade finished
-                        self.actual_volumes[ch] = (
-                            self.target_volumes.get(ch, self.actual_volumes.get(ch, 0.0))
-                        )
-                    self.fade_start_time = None
-                    self.fade_start_volumes = None
-                else:
-                    progress = elapsed / FADE_DURATION_SECONDS
-                    for ch in [self.ch_chars, self.ch_spaces, self.ch_hum]:
-                        # fade_start_volumes can be None in some race conditions;
-                        # fall back to current actual volume
-                        if self.fade_start_volumes is None:
-                            start_vol = self.actual_volumes.get(ch, 0.0)
-                        else:
-                            start_vol = self.fade_start_volumes.get(
-                                ch,
-                                self.actual_volumes.get(ch, 0.0)
-                            )
-                        target_vol = self.target_volumes.get(ch, 0.0)
-                        new_volume = start_vol + (target_vol - start_vol) * progress
-                        self.actual_volumes[ch] = max(0.0, min(1.0, new_volume))
-
-            mute_factor = 1.0
-            if self.is_muted and self.mute_fade_start is None:
-                mute_factor = 0.0
-            if self.mute_fade_start is not None:
-                elapsed = time.time() - self.mute_fade_start
-                # compute safe defaults if fade endpoints were not set
-                default_to = 0.0 if self.is_muted else 1.0
-                default_from = 1.0 if self.is_muted else 0.0
-                to_val = self.mute_fade_to if self.mute_fade_to is not None else default_to
-                from_val = self.mute_fade_from if self.mute_fade_from is not None else default_from
-                if elapsed >= MUTE_FADE_SECONDS:
-                    mute_factor = to_val
-                    self.mute_fade_start = None
-                else:
-                    progress = elapsed / MUTE_FADE_SECONDS
-                    mute_factor = from_val + (to_val - from_val) * progress
-            for ch in [
-                self.ch_chars,
-                self.ch_spaces,
-                self.ch_hum,
-                self.ch_tape_reader,
-                self.ch_effects
-            ]:
-                intended_volume = self.actual_volumes[ch]
-                final_volume = intended_volume * mute_factor
-                ch.set_volume(final_volume)
+        if not self._dirty:
+            return  # Nothing has changed since the volumes last settled
+        # Cleared before reading any state, so a change made meanwhile by
+        # another thread sets it again and is picked up next time
+        self._dirty = False
+        if now is None:
+            now = time.monotonic()
+        actual = self.actual_volumes
+        if self.fade_start_time is not None:
+            elapsed = now - self.fade_start_time
+            if elapsed >= FADE_DURATION_SECONDS:
+                # Use target volumes if fade finished
+                actual[:self.FADED_CHANNELS] = self.target_volumes
+                self.fade_start_time = None
+                self.fade_start_volumes = None
+            else:
+                self._dirty = True
+                progress = elapsed / FADE_DURATION_SECONDS
+                # fade_start_volumes can be None in some race conditions;
+                # fall back to current actual volume
+                start = self.fade_start_volumes
+                if start is None:
+                    start = actual[:self.FADED_CHANNELS]
+                for i, (start_vol, target_vol) in enumerate(zip(start, self.target_volumes)):
+                    new_volume = start_vol + (target_vol - start_vol) * progress
+                    actual[i] = max(0.0, min(1.0, new_volume))
+
+        # Read once: set_mute_status may replace it from another thread.
+        # It is the only mute state the worker reads, so it can't be torn.
+        mute_fade = self.mute_fade
+        if mute_fade is None:
+            mute_factor = 1.0  # Never muted
+        else:
+            fade_start, from_val, to_val = mute_fade
+            elapsed = now - fade_start
+            if elapsed >= MUTE_FADE_SECONDS:
+                mute_factor = to_val
+            else:
+                progress = elapsed / MUTE_FADE_SECONDS
+                mute_factor = from_val + (to_val - from_val) * progress
+                self._dirty = True
 
-            if not self.ch_effects.get_busy() and self.actual_volumes[self.ch_effects] != 0.0:
-                self.actual_volumes[self.ch_effects] = 0.0
+        if actual[self.IDX_EFFECTS] != 0.0:
+            if now >= self._effect_end_time:
+                actual[self.IDX_EFFECTS] = 0.0
+            else:
+                self._dirty = True
+
+        # Only call into the mixer for channels whose volume actually changed
+        applied = self._applied_volumes
+        if self._reapply_volumes:
+            # Channels were restarted; clear the flag first so a later request isn't lost
+            self._reapply_volumes = False
+            applied[:] = [None] * len(applied)
+        for i, (ch, intended_volume) in enumerate(zip(self._channels, actual)):
+            final_volume = intended_volume * mute_factor
+            last_volume = applied[i]
+            if last_volume is None or abs(final_volume - last_volume) > VOLUME_EPSILON:
+                ch.set_volume(final_volume)
+                applied[i] = final_volume
 
 def _sounds_worker(manager_instance) -> None:
     """Main loop for the audio thread."""
+    raise_current_thread_priority()
+    event_queue = manager_instance.event_queue
     while manager_instance.running:
-        while not manager_instance.event_queue.empty():
-            char_type, playtime_ms = manager_instance.event_queue.get()
-            manager_instance.process_event(char_type, playtime_ms)
+        # Sleep until an event arrives or a fade/timeout needs servicing,
+        # then handle everything that has queued up
+        events = []
+        try:
+            item = event_queue.get(timeout=manager_instance.next_deadline())
+            while True:
+                if isinstance(item, list):
+                    events.extend(item)  # A batch from new_character_events()
+                elif item is not None:  # None only wakes the worker
+                    events.append(item)
+                item = event_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Only the last continuous-sound event of a burst decides the state;
+        # every effect still gets processed
+        now = time.monotonic()
+        state_event = None
+        for event in events:
+            if event[0] in _CONTINUOUS_EVENTS:
+                state_event = event
+            else:
+                manager_instance.process_event(*event, now=now)
+        if state_event is not None:
+            manager_instance.process_event(*state_event, now=now)
 
-        manager_instance.check_inactivity()
+        manager_instance.check_inactivity(now)
 
-        with manager_instance.lock:
-            if (
-                not manager_instance.ch_effects.get_busy() and
-                not manager_instance.effects_queue.empty()
-            ):
-                manager_instance.play_next_effect()
+        if (
+            now >= manager_instance._effect_end_time and  # pylint: disable=protected-access
+            manager_instance.effects_queue
+        ):
+            manager_instance.play_next_effect(now)
 
-        manager_instance.update_volumes()
-        time.sleep(UPDATE_INTERVAL_SECONDS)
+        manager_instance.update_volumes(now)
 
     mixer.quit()
 
@@ -374,16 +504,16 @@ class ASR33AudioModule:
 
     def print_char(self, ch: str) -> None:
         """Sends a character event to the state machine, with optional playtime limit."""
-        if ch == '\r':  # carriage return
-            self.tt_manager.new_character_event("cr", CR_PLAY_TIME)
-        elif ch == '\n':  # line feed
-            self.tt_manager.new_character_event("platen", PLATEN_PLAY_TIME)
-        elif ch == '\a':  # bell character
-            self.tt_manager.new_character_event("bell", BELL_PLAY_TIME)
-        elif ch <= " " or ch > "~":  # control or non-printable
-            self.tt_manager.new_character_event("print-spaces")
-        else:
-            self.tt_manager.new_character_event("print-chars")
+        code = ord(ch)
+        event, playtime_ms = _CHAR_EVENTS[code] if code < 128 else _SPACE_EVENT
+        self.tt_manager.new_character_event(event, playtime_ms)
+
+    def print_string(self, text: str) -> None:
+        """Sends the character events for a whole string as a single batch."""
+        self.tt_manager.new_character_events([
+            _CHAR_EVENTS[code] if code < 128 else _SPACE_EVENT
+            for code in map(ord, text)
+        ])
 
     def platen(self, playtime_ms=PLATEN_PLAY_TIME) -> None:
         """Sends a platen (line feed) event."""
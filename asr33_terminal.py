@@ -2,41 +2,96 @@
 
 """ ASR-33 Terminal Emulator Core"""
 
+import re
 import threading
+from collections import deque
+from itertools import chain, cycle, islice, repeat
 from typing import Any
 
+# bytes.translate tables for the 8th (parity) bit of 7-bit ASCII data
+_EVEN_PARITY_TABLE = bytes(
+    (b | 0x80) if bin(b & 0x7F).count("1") & 1 else (b & 0x7F) for b in range(256)
+)
+_MASK7_TABLE = bytes(b & 0x7F for b in range(256))
+
+# EscapeShim states
+_GROUND, _ESC, _CSI, _OSC = range(4)
+
+# EscapeShim state after ESC: CSI or OSC introducers, anything else ends the sequence
+_ESC_NEXT = {"[": _CSI, "]": _OSC}
+
+# EscapeShim CSI terminator: final byte in @-~
+_CSI_END = re.compile(r"[@-~]")
+
+# Printable 7-bit ASCII characters (the same set str.isprintable accepts below 0x80)
+_IS_PRINTABLE = bytes(1 if 0x20 <= c <= 0x7E else 0 for c in range(128))
+
+# Splits received text into alternating control-character and printable-run parts
+_PRINTABLE_RUN = re.compile(r"([ -~]+)")
+
+
 class Line:
-    """A single line in the terminal, supporting overstrike."""
+    """
+    A single line in the terminal, supporting overstrike.
+
+    Line has no lock of its own: writers go through LineHistory, which holds
+    its lock around every add_char/add_run. Readers may run concurrently; each
+    read is a single list or dict operation, so at worst it misses the
+    strike being added at that moment.
+    """
 
     def __init__(self, width: int, logical_line_number: int | None = None):
         """Initialize a line with given width, supporting overstrike."""
-        # Each column holds a list of strikes (characters overstruck in that cell)
-        self.cells = [[] for _ in range(width)]
+        # Top strike of each column (space when nothing has been printed there)
+        self.top = [" "] * width
+        # Full strike stacks, only for the few columns that have been overstruck
+        self.extra: dict[int, list[str]] | None = None
         self.width = width
         self.logical_line_number = logical_line_number  # optional logical line number
-        self._lock = threading.Lock() # Add a lock for thread safety
+
+    def _strike(self, col: int, ch: str):
+        """Strike ch over whatever is already printed at col."""
+        prior = self.top[col]
+        if self.extra is not None and col in self.extra:
+            self.extra[col].append(ch)
+        elif prior != " ":
+            if self.extra is None:
+                self.extra = {}
+            self.extra[col] = [prior, ch]
+        self.top[col] = ch
 
     def add_char(self, col: int, ch: str):
         """Add a character at the given column, supporting overstrike."""
-        # Acquire lock before modifying shared data (self.cells)
-        with self._lock:
-            if 0 <= col < self.width:
-                self.cells[col].append(ch)
+        if 0 <= col < self.width:
+            self._strike(col, ch)
+
+    def add_run(self, col: int, text: str):
+        """Add a run of characters starting at the given column, supporting overstrike."""
+        end = min(col + len(text), self.width)
+        if col < 0 or col >= end:
+            return
+        text = text[:end - col]
+        if self.extra is None and self.top[col:end].count(" ") == end - col:
+            # Nothing printed there yet, so nothing is overstruck
+            self.top[col:end] = text
+        else:
+            for i, ch in enumerate(text, col):
+                self._strike(i, ch)
 
     def get_strike_stack(self, col: int):
         """Return the list of strikes at a given column."""
-        # Acquire lock before reading shared data (self.cells)
-        with self._lock:
-            if 0 <= col < self.width:
+        if 0 <= col < self.width:
+            extra = self.extra
+            if extra is not None and col in extra:
                 # Return a copy to prevent external modification of the internal list
-                return self.cells[col][:]
-            return []
+                return extra[col][:]
+            ch = self.top[col]
+            return [ch] if ch != " " else []
+        return []
 
     def __repr__(self):
-        # Acquire lock before reading shared data (self.cells)
-        with self._lock:
-            # For debugging: show the top strike of each cell
-            return "".join(stack[-1] if stack else " " for stack in self.cells)
+        # For debugging: show the top strike of each cell
+        return "".join(self.top)
 
 
 class LineHistory:
@@ -44,17 +99,37 @@ class LineHistory:
     def __init__(self, max_lines: int, width: int, logical_line: int):
         self.max_lines = max_lines
         self.width = width
-        self.lines = [Line(width, logical_line_number=logical_line)]  # start with one blank line
+        # Oldest lines fall off the left once max_lines is reached
+        self.lines = deque(
+            [Line(width, logical_line_number=logical_line)],  # start with one blank line
+            maxlen=max_lines
+        )
         self.top_index = 0  # index of the first logical line
-        self._lock = threading.Lock() # Add a lock for thread safety
+        # Cached for the lock-free readers below; only written under the lock
+        self._bottom_lln = logical_line
+        self._len = 1
+        # Reentrant, so a writer can hold it across a batch of updates (see batch())
+        self._lock = threading.RLock()
+
+    def batch(self):
+        """
+        Return a context manager that holds the history lock, so a run of
+        add_char/add_run/add_line calls takes it only once.
+        """
+        return self._lock
 
     def add_char(self, col: int, ch: str):
         """Add an overstrike-capable character in the last row at the given column."""
         # This method uses self.lines[-1], which can change if another thread calls add_line.
-        # Lock LineHistory, then call the thread-safe Line method.
+        # Lock LineHistory, which also guards the Line being written.
         with self._lock:
             self.lines[-1].add_char(col, ch)
 
+    def add_run(self, col: int, text: str):
+        """Add a run of characters in the last row, starting at the given column."""
+        with self._lock:
+            self.lines[-1].add_run(col, text)
+
     def add_line(self, logical_line_number: int | None = None):
         """Append a new blank line at the bottom, discarding the oldest if needed."""
         # Acquire lock before modifying shared data (self.lines, self.top_index)
@@ -62,41 +137,35 @@ class LineHistory:
             new_line = Line(self.width)
             if logical_line_number is not None:
                 new_line.logical_line_number = logical_line_number
-            self.lines.append(new_line)
-            if len(self.lines) > self.max_lines:
-                self.lines.pop(0)
+            self.lines.append(new_line)  # discards the oldest line when full
             # Ensure index update happens under lock
             self.top_index = self.lines[0].logical_line_number if self.lines else 0
+            self._bottom_lln = new_line.logical_line_number
+            self._len = len(self.lines)
 
     def get_line(self, row: int) -> Line:
         """Get the row-th line from line_history."""
         # Acquire lock before reading shared data (self.lines)
         with self._lock:
             if 0 <= row < len(self.lines):
-                 # Return the line object itself (which is now thread-safe internally)
+                # Return the line object itself (safe to read without the lock)
                 return self.lines[row]
             return Line(self.width)
 
     def bottom_lln(self) -> int | None:
         """Return the logical line number of the last line in history."""
-        # Acquire lock before reading shared data (self.lines)
-        with self._lock:
-            if self.lines:
-                return self.lines[-1].logical_line_number
-            return 0
+        # No lock: _bottom_lln is replaced in a single (atomic) store by add_line
+        return self._bottom_lln
 
     def top_lln(self) -> int | None:
-        """Return the logical line number of the last line in history."""
-        # Acquire lock before reading shared data (self.lines, self.top_index)
-        with self._lock:
-            # Can return the cached top_index as it's updated under a lock
-            return self.top_index
+        """Return the logical line number of the first line in history."""
+        # No lock: top_index is replaced in a single (atomic) store by add_line
+        return self.top_index
 
     def __len__(self) -> int:
         """Return number of lines currently in history."""
-        # Acquire lock before reading shared data (self.lines)
-        with self._lock:
-            return len(self.lines)
+        # No lock: _len is replaced in a single (atomic) store by add_line
+        return self._len
 
 
 class EscapeShim:
@@ -104,7 +173,8 @@ class EscapeShim:
        CSI and OSC ANSI escape sequences.
     """
     def __init__(self):
-        self.state = "GROUND"
+        self.state = _GROUND
+        self._pending = ""  # an ESC that may start an OSC's ST in the next feed
 
     def feed(self, data: str) -> str:
         """
@@ -112,40 +182,49 @@ class EscapeShim:
         stripping CSI and OSC escape sequences.
         """
         out = []
-        for ch in data:
-            if self.state == "GROUND":
-                if ch == "\x1b":
-                    self.state = "ESC"
-                else:
-                    out.append(ch)
-
-            elif self.state == "ESC":
-                if ch == "[":
-                    self.state = "CSI"
-                elif ch == "]":
-                    self.state = "OSC"
-                else:
-                    # swallow single-char ESC sequences
-                    self.state = "GROUND"
-
-            elif self.state == "CSI":
+        state = self.state
+        if self._pending:
+            data = self._pending + data
+            self._pending = ""
+        pos = 0
+        end = len(data)
+        while pos < end:
+            if state == _GROUND:
+                # Plain text: copy everything up to the next ESC in one slice
+                esc = data.find("\x1b", pos)
+                if esc < 0:
+                    out.append(data[pos:])
+                    break
+                out.append(data[pos:esc])
+                pos = esc + 1
+                state = _ESC
+
+            elif state == _ESC:
+                # CSI or OSC introducer; swallow other single-char ESC sequences
+                state = _ESC_NEXT.get(data[pos], _GROUND)
+                pos += 1
+
+            elif state == _CSI:
                 # swallow until final byte in @-~
-                if "@" <= ch <= "~":
-                    self.state = "GROUND"
+                m = _CSI_END.search(data, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                state = _GROUND
 
-            elif self.state == "OSC":
+            elif state == _OSC:
                 # swallow until BEL or ST (ESC \)
-                if ch == "\x07":
-                    self.state = "GROUND"
-                elif ch == "\x1b":
-                    self.state = "OSC_ESC"
-            elif self.state == "OSC_ESC":
-                if ch == "\\":
-                    self.state = "GROUND"
-                else:
-                    # not actually ST, stay in OSC
-                    self.state = "OSC"
-
+                bel = data.find("\x07", pos)
+                st = data.find("\x1b\\", pos)
+                if bel < 0 and st < 0:
+                    if data.endswith("\x1b"):
+                        # Possibly the first half of an ST split across feeds
+                        self._pending = "\x1b"
+                    break
+                pos = bel + 1 if st < 0 or 0 <= bel < st else st + 2
+                state = _GROUND
+
+        self.state = state
         return "".join(out)
 
 
@@ -178,7 +257,7 @@ class Terminal:
             width=self.width,
             logical_line=self.cur_line_number
         )
-        self.sound_playback_queue = []
+        self.sound_playback_queue: deque[tuple[str, int]] = deque()
         self._print_enabled = True
 
     def encode_even_parity(self, byte_data: bytes) -> bytes:
@@ -188,24 +267,11 @@ class Terminal:
 
         The input data is assumed to be 7-bit clean (MSB is 0).
         """
-        # We use a bytearray for efficient modification of individual bytes
-        encoded_data = bytearray(byte_data)
-        for i, current_byte in enumerate(encoded_data):
-            current_byte = encoded_data[i]
-            parity_bit = (current_byte ^ (current_byte >> 1) ^ (current_byte >> 2) ^
-                        (current_byte >> 3) ^ (current_byte >> 4) ^ (current_byte >> 5) ^
-                        (current_byte >> 6) ^ (current_byte >> 7)) & 1
-
-            if parity_bit == 1:
-                encoded_data[i] = current_byte | 0x80
-            else:
-                encoded_data[i] = current_byte & 0x7F
-
-        return bytes(encoded_data)
+        return byte_data.translate(_EVEN_PARITY_TABLE)
 
     def mask_parity_bit(self, data: bytes) -> bytes:
         """ Mask off the parity bit (8th bit) from each byte in data. """
-        return bytes([b & 0x7F for b in data])
+        return data.translate(_MASK7_TABLE)
 
     def receive_data(self, data: bytes) -> None:
         """ Accept data (as bytes) from backend (thread) and process it."""
@@ -215,50 +281,95 @@ class Terminal:
         # Strip out escape sequences
         # Not ASR-33 behavior, but useful for Linux terminal output
         char_data = self.esc_stripper.feed(char_data)
-        if self._print_enabled:
-            for ch in char_data:
-                if ch == "\r":
-                    # Carriage return: reset column
-                    self.cur_col = 0
-                elif ch == "\n" or ch == "\v":
-                    # Line feed: move to next line
-                    self.cur_line_number += 1  # Increment logical line number
-                    self.line_history.add_line(logical_line_number=self.cur_line_number)
-                elif ch == "\b":
-                    # Backspace: move cursor left (not an ASR-33 behavior but useful)
-                    if self.cur_col > 0:
-                        self.cur_col -= 1
-                elif ch == "\t":
-                    # Tab: advance to next multiple of 8
-                    self.cur_col = (self.cur_col + 8) & ~7
-                elif ch == "\f":
-                    # Form feed: move cursor left (not an ASR-33 behavior but useful)
-                    if self.cur_col > 0:
-                        self.cur_col -= 1
-                else:
-                    # Only accept printable characters
-                    if ch.isprintable():
-                        self.line_history.add_char(self.cur_col, ch)
-                        self.cur_col += 1
-
-                # Handle autowrap if enabled
-                if self.autowrap and self.cur_col >= self.width:
-                    # If autowrap enabled, move to next line
-                    self.cur_col -= self.width
-                    self.cur_line_number += 1  # Increment logical line number
-                    self.line_history.add_line(logical_line_number=self.cur_line_number)
-
-                # Limit cursor column, to screen width
-                self.cur_col = min(self.cur_col, self.width-1)
-
-                # Queue character for sound playback
-                self.sound_playback_queue.append((ch, self.cur_col))
+        if self._print_enabled and char_data:
+            with self.line_history.batch():
+                # Odd-numbered parts are runs of printable characters
+                for index, part in enumerate(_PRINTABLE_RUN.split(char_data)):
+                    if index & 1:
+                        self._print_run(part)
+                    elif part:
+                        self._receive_chars(part)
 
         # Send unmasked, unstripped 8-bit data to frontend if needed
         if len(data) > 0:
             if hasattr(self.frontend, 'receive_data'):
                 self.frontend.receive_data(data)
 
+    def _print_run(self, run: str) -> None:
+        """ Print a run of printable characters, with autowrap or margin overstrike. """
+        history = self.line_history
+        width = self.width
+        col = self.cur_col
+        end = col + len(run)
+        if end < width:
+            # The whole run fits on this line
+            history.add_run(col, run)
+            self.cur_col = end
+            self.sound_playback_queue.extend(zip(run, range(col + 1, end + 1)))
+        elif self.autowrap:
+            # Column after each character counts up to the margin, then wraps to 0
+            self.sound_playback_queue.extend(zip(run, islice(cycle(range(width)), col + 1, None)))
+            pos = 0
+            while pos < len(run):
+                piece = run[pos:pos + width - col]
+                history.add_run(col, piece)
+                pos += len(piece)
+                col += len(piece)
+                if col == width:
+                    col = 0
+                    self.cur_line_number += 1  # Increment logical line number
+                    history.add_line(logical_line_number=self.cur_line_number)
+            self.cur_col = col
+        else:
+            # Characters past the margin all strike the last column
+            history.add_run(col, run[:width - col])
+            for ch in run[width - col:]:
+                history.add_char(width - 1, ch)
+            self.cur_col = width - 1
+            self.sound_playback_queue.extend(
+                zip(run, chain(range(col + 1, width), repeat(width - 1)))
+            )
+
+    def _receive_chars(self, char_data: str) -> None:
+        """ Process received characters one at a time. """
+        for ch in char_data:
+            if ch == "\r":
+                # Carriage return: reset column
+                self.cur_col = 0
+            elif ch == "\n" or ch == "\v":
+                # Line feed: move to next line
+                self.cur_line_number += 1  # Increment logical line number
+                self.line_history.add_line(logical_line_number=self.cur_line_number)
+            elif ch == "\b":
+                # Backspace: move cursor left (not an ASR-33 behavior but useful)
+                if self.cur_col > 0:
+                    self.cur_col -= 1
+            elif ch == "\t":
+                # Tab: advance to next multiple of 8
+                self.cur_col = (self.cur_col + 8) & ~7
+            elif ch == "\f":
+                # Form feed: move cursor left (not an ASR-33 behavior but useful)
+                if self.cur_col > 0:
+                    self.cur_col -= 1
+            else:
+                # Only accept printable characters (text is 7-bit after masking)
+                if _IS_PRINTABLE[ord(ch)]:
+                    self.line_history.add_char(self.cur_col, ch)
+                    self.cur_col += 1
+
+            # Handle autowrap if enabled
+            if self.autowrap and self.cur_col >= self.width:
+                # If autowrap enabled, move to next line
+                self.cur_col -= self.width
+                self.cur_line_number += 1  # Increment logical line number
+                self.line_history.add_line(logical_line_number=self.cur_line_number)
+
+            # Limit cursor column, to screen width
+            self.cur_col = min(self.cur_col, self.width-1)
+
+            # Queue character for sound playback
+            self.sound_playback_queue.append((ch, self.cur_col))
+
     def send_data(self, data: bytes) -> None:
         """ Send data (as bytes) to backend. """
         if self._comm_interface:
@@ -279,9 +390,10 @@ class Terminal:
         Pop the next (char, col) tuple from the new character queue.
         Returns None if queue is empty.
         """
-        if self.sound_playback_queue:
-            return self.sound_playback_queue.pop(0)
-        return None
+        try:
+            return self.sound_playback_queue.popleft()
+        except IndexError:
+            return None
 
     def enable_printing(self):
         """ Enable printing of received characters. """
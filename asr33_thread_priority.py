@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+"""
+Best-effort scheduling priority for the ASR-33 emulator's timing-sensitive threads.
+
+The backend rx threads are the real-time path from the host to the printer,
+and the sound worker steps the volume fades, so scheduling jitter there shows
+up as uneven teletype timing or audible glitches. On Linux they ask for
+SCHED_FIFO, which requires CAP_SYS_NICE (or a non-zero RLIMIT_RTPRIO),
+falling back to a negative nice value, which requires CAP_SYS_NICE or
+RLIMIT_NICE. Without the privilege, or on other platforms, nothing changes.
+"""
+
+import os
+import sys
+
+RT_PRIORITY = 10   # SCHED_FIFO priority (1-99); modest, so kernel threads still win
+NICE_BOOST = -5    # Fallback niceness adjustment
+
+
+def raise_current_thread_priority() -> bool:
+    """
+    Raise the scheduling priority of the calling thread, if permitted.
+    Returns True if the priority was changed.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    # On Linux, pid 0 / nice() apply to the calling thread only
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+        return True
+    except (AttributeError, OSError):
+        pass
+
+    try:
+        os.nice(NICE_BOOST)
+        return True
+    except OSError:
+        return False
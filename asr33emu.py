@@ -13,14 +13,12 @@ Usage examples:
 import sys
 
 from asr33_config import ASR33Config
-from asr33_backend_serial import SerialBackend
-from asr33_backend_ssh import SSHV2Backend
-from asr33_backend_pty import PtyBackend
 from asr33_shim_throttle import DataThrottle
 from asr33_terminal import Terminal
 from asr33_sounds_sm import ASR33AudioModule as ASR33_Sounds
-from asr33_frontend_pygame import ASR33PygameFrontend as PygameFrontend
-from asr33_frontend_tk import ASR33TkFrontend as TkFrontend
+# Backends and frontends are imported only when selected, so an unused backend
+# library (pyserial, paramiko) is never loaded. pygame is always loaded for
+# sound, and the pygame frontend also uses tkinter.
 
 
 DEFAULT_FRONTEND = "tkinter"
@@ -60,6 +58,7 @@ class EmulatorWrapper:
         Args:
             config: ASR33Config instance (already loaded and validated)
         """
+        # pylint: disable=import-outside-toplevel
         self.comm_backend = None
         self.data_throttle = None
         self.term = None
@@ -83,18 +82,21 @@ class EmulatorWrapper:
         else:
             backend_type = backend_cfg.get("type", default=DEFAULT_BACKEND)
             if backend_type == "serial":
+                from asr33_backend_serial import SerialBackend
                 cfg = backend_cfg.serial_config
                 self.comm_backend = SerialBackend(
                     upper_layer=None,  # Forward reference set later
                     config=cfg
                 )
             elif backend_type == "ssh":
+                from asr33_backend_ssh import SSHV2Backend
                 cfg = backend_cfg.ssh_config
                 self.comm_backend = SSHV2Backend(
                     upper_layer=None,
                     config=cfg
                 )
             elif backend_type == "pty":
+                from asr33_backend_pty import PtyBackend
                 self.comm_backend = PtyBackend(
                     upper_layer=None
                 )
@@ -123,6 +125,7 @@ class EmulatorWrapper:
         # Frontend
         frontend_type = frontend_cfg.get("type", default=DEFAULT_FRONTEND)
         if frontend_type == "pygame":
+            from asr33_frontend_pygame import ASR33PygameFrontend as PygameFrontend
             self.frontend = PygameFrontend(
                 terminal=self.term,
                 backend=self.data_throttle,
@@ -130,6 +133,7 @@ class EmulatorWrapper:
                 sound=self.sound
             )
         elif frontend_type == "tkinter":
+            from asr33_frontend_tk import ASR33TkFrontend as TkFrontend
             self.frontend = TkFrontend(
                 terminal=self.term,
                 backend=self.data_throttle,
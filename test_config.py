@@ -6,6 +6,7 @@ Run with: python -m pytest test_config.py -v
 Or just:  python test_config.py
 """
 
+import itertools
 import os
 import sys
 import tempfile
@@ -23,12 +24,48 @@ from asr33_config import (
     find_config_file,
     get_default_config_paths,
     get_user_config_path,
+    invalidate_port_cache,
     is_valid_port,
     list_serial_ports,
     _get_platform_config_dir,
+    _import_yaml,
+    _platform_config_dir,
+    _reset_config_path_cache,
+    _load_config_cached,
+    _parse_config_file,
 )
 
 
+_cache_dir = None
+_module_patches = []
+
+
+def setUpModule():
+    """
+    Keep parsed-config pickles out of the real user cache directory, and
+    share one serial port scan across the whole module (tests that need a
+    fresh scan call invalidate_port_cache()).
+    """
+    global _cache_dir
+    _cache_dir = tempfile.TemporaryDirectory()
+    _module_patches.extend([
+        mock.patch(
+            "asr33_config._get_platform_cache_dir", return_value=Path(_cache_dir.name)
+        ),
+        mock.patch("asr33_config.PORT_CACHE_TTL_SECONDS", float("inf")),
+    ])
+    for patch in _module_patches:
+        patch.start()
+
+
+def tearDownModule():
+    for patch in reversed(_module_patches):
+        patch.stop()
+    _module_patches.clear()
+    _cache_dir.cleanup()
+    invalidate_port_cache()
+
+
 class TestConfigNode(unittest.TestCase):
     """Tests for ConfigNode wrapper class."""
 
@@ -38,6 +75,29 @@ class TestConfigNode(unittest.TestCase):
         node = ConfigNode(data)
         self.assertEqual(node.level1.level2.value, 42)
 
+    def test_nested_nodes_are_reused(self):
+        """Test nested nodes are built once rather than on every access."""
+        node = ConfigNode({"level1": {"level2": {"value": 42}}})
+        self.assertIs(node.level1, node.level1)
+        self.assertIs(node.level1.level2, node.level1.level2)
+
+    def test_item_access(self):
+        """Test item-style access returns the same nodes as attribute access."""
+        node = ConfigNode({"sound": {"config": {"lid": "up"}}, "get": 1})
+        self.assertIs(node["sound"], node.sound)
+        self.assertEqual(node["sound"]["config"]["lid"], "up")
+        self.assertEqual(node["get"], 1)
+        with self.assertRaises(KeyError):
+            _ = node["missing"]
+
+    def test_method_names_as_keys(self):
+        """Test keys that collide with methods remain available via get()."""
+        node = ConfigNode({"get": 1, "to_dict": 2, "_data": 3})
+        self.assertEqual(node.get("get"), 1)
+        self.assertEqual(node.get("to_dict"), 2)
+        self.assertEqual(node.get("_data"), 3)
+        self.assertEqual(node.to_dict(), {"get": 1, "to_dict": 2, "_data": 3})
+
     def test_get_nested(self):
         """Test get() method for nested keys."""
         data = {"a": {"b": {"c": "deep"}}}
@@ -58,6 +118,13 @@ class TestConfigNode(unittest.TestCase):
         node = ConfigNode(data)
         self.assertEqual(node.to_dict(), data)
 
+    def test_to_dict_of_defaults_is_mutable(self):
+        """Test to_dict() gives a plain dict even when backed by the frozen defaults."""
+        node = ConfigNode(DEFAULT_CONFIG)
+        data = node.to_dict()
+        data["terminal"]["config"]["rows"] = 99
+        self.assertNotEqual(DEFAULT_CONFIG["terminal"]["config"]["rows"], 99)
+
 
 class TestDeepMerge(unittest.TestCase):
     """Tests for deep_merge function."""
@@ -84,51 +151,71 @@ class TestDeepMerge(unittest.TestCase):
         deep_merge(base, overlay)
         self.assertEqual(base["a"], 1)
 
+    def test_result_shares_no_nested_dicts(self):
+        """Test that mutating the result leaves both inputs untouched."""
+        base = {"outer": {"inner": 1}}
+        overlay = {"added": {"value": 2}}
+        result = deep_merge(base, overlay)
+        result["outer"]["inner"] = 99
+        result["added"]["value"] = 99
+        self.assertEqual(base["outer"]["inner"], 1)
+        self.assertEqual(overlay["added"]["value"], 2)
+
 
 class TestPlatformConfigDir(unittest.TestCase):
     """Tests for cross-platform config directory detection."""
 
+    def setUp(self):
+        _reset_config_path_cache()
+
+    def tearDown(self):
+        _reset_config_path_cache()
+
     def test_windows_appdata(self):
         """Test Windows uses APPDATA."""
-        with mock.patch.object(sys, "platform", "win32"):
-            with mock.patch.dict(os.environ, {"APPDATA": "C:\\Users\\Test\\AppData\\Roaming"}):
-                result = _get_platform_config_dir()
-                self.assertEqual(result, Path("C:\\Users\\Test\\AppData\\Roaming") / "asr33emu")
+        result = _platform_config_dir("win32", {"APPDATA": "C:\\Users\\Test\\AppData\\Roaming"})
+        self.assertEqual(result, Path("C:\\Users\\Test\\AppData\\Roaming") / "asr33emu")
 
     def test_windows_localappdata_fallback(self):
         """Test Windows falls back to LOCALAPPDATA."""
-        with mock.patch.object(sys, "platform", "win32"):
-            with mock.patch.dict(os.environ, {"LOCALAPPDATA": "C:\\Users\\Test\\AppData\\Local"}, clear=True):
-                result = _get_platform_config_dir()
-                self.assertEqual(result, Path("C:\\Users\\Test\\AppData\\Local") / "asr33emu")
+        result = _platform_config_dir("win32", {"LOCALAPPDATA": "C:\\Users\\Test\\AppData\\Local"})
+        self.assertEqual(result, Path("C:\\Users\\Test\\AppData\\Local") / "asr33emu")
 
     def test_linux_xdg_config(self):
         """Test Linux uses XDG_CONFIG_HOME."""
-        with mock.patch.object(sys, "platform", "linux"):
-            with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": "/home/test/.config"}):
-                result = _get_platform_config_dir()
-                self.assertEqual(result, Path("/home/test/.config") / "asr33emu")
+        result = _platform_config_dir("linux", {"XDG_CONFIG_HOME": "/home/test/.config"})
+        self.assertEqual(result, Path("/home/test/.config") / "asr33emu")
 
     def test_linux_default_config(self):
         """Test Linux defaults to ~/.config when XDG not set."""
-        with mock.patch.object(sys, "platform", "linux"):
-            with mock.patch.dict(os.environ, {}, clear=True):
-                with mock.patch.object(Path, "home", return_value=Path("/home/test")):
-                    result = _get_platform_config_dir()
-                    self.assertEqual(result, Path("/home/test/.config/asr33emu"))
+        result = _platform_config_dir("linux", {}, home=Path("/home/test"))
+        self.assertEqual(result, Path("/home/test/.config/asr33emu"))
 
     def test_macos_uses_xdg_style(self):
         """Test macOS uses same logic as Linux."""
-        with mock.patch.object(sys, "platform", "darwin"):
-            with mock.patch.dict(os.environ, {}, clear=True):
-                with mock.patch.object(Path, "home", return_value=Path("/Users/test")):
-                    result = _get_platform_config_dir()
-                    self.assertEqual(result, Path("/Users/test/.config/asr33emu"))
+        result = _platform_config_dir("darwin", {}, home=Path("/Users/test"))
+        self.assertEqual(result, Path("/Users/test/.config/asr33emu"))
+
+    def test_result_is_cached_until_reset(self):
+        """Test environment changes are only picked up after a cache reset."""
+        with mock.patch.object(sys, "platform", "linux"):
+            with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": "/first"}):
+                self.assertEqual(_get_platform_config_dir(), Path("/first/asr33emu"))
+            with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": "/second"}):
+                self.assertEqual(_get_platform_config_dir(), Path("/first/asr33emu"))
+                _reset_config_path_cache()
+                self.assertEqual(_get_platform_config_dir(), Path("/second/asr33emu"))
 
 
 class TestConfigPaths(unittest.TestCase):
     """Tests for config path functions."""
 
+    def setUp(self):
+        _reset_config_path_cache()
+
+    def tearDown(self):
+        _reset_config_path_cache()
+
     def test_default_paths_includes_cwd(self):
         """Test that current directory config is checked first."""
         paths = get_default_config_paths()
@@ -152,6 +239,79 @@ class TestConfigPaths(unittest.TestCase):
                         # Just verify it doesn't crash
 
 
+class TestConfigFileCache(unittest.TestCase):
+    """Tests for the parsed config file cache."""
+
+    def test_cached_parse_matches_yaml(self):
+        """Test a cached load returns the same data as the first parse."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("terminal:\n  config:\n    columns: 80\n", encoding="utf-8")
+            first = _load_config_cached(path)
+            with mock.patch("asr33_config._import_yaml") as import_yaml:
+                second = _load_config_cached(path)
+                import_yaml.assert_not_called()
+            self.assertEqual(first, {"terminal": {"config": {"columns": 80}}})
+            self.assertEqual(second, first)
+
+    def test_repeat_load_is_memoized_in_process(self):
+        """Test loading an unchanged file again doesn't touch the disk cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("sound:\n  config:\n    lid: down\n", encoding="utf-8")
+            first = _load_config_cached(path)
+            with mock.patch("asr33_config.pickle.load") as pickle_load:
+                second = _load_config_cached(path)
+                pickle_load.assert_not_called()
+            self.assertIs(second, first)
+
+    def test_modified_file_is_reparsed(self):
+        """Test changing the file (and its mtime) bypasses the old cache entry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("frontend:\n  type: pygame\n", encoding="utf-8")
+            _load_config_cached(path)
+            path.write_text("frontend:\n  type: tkinter\n", encoding="utf-8")
+            mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(_load_config_cached(path)["frontend"]["type"], "tkinter")
+
+    def test_one_disk_cache_entry_per_file(self):
+        """Test re-parsing an edited file replaces its pickle rather than adding one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("terminal:\n  config:\n    rows: 24\n", encoding="utf-8")
+            _load_config_cached(path)
+            before = set(Path(_cache_dir.name).iterdir())
+            path.write_text("terminal:\n  config:\n    rows: 25\n", encoding="utf-8")
+            mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(_load_config_cached(path)["terminal"]["config"]["rows"], 25)
+            self.assertEqual(set(Path(_cache_dir.name).iterdir()), before)
+
+    def test_corrupt_disk_cache_falls_back_to_yaml(self):
+        """Test a garbage pickle in the cache dir is ignored, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("terminal:\n  config:\n    rows: 24\n", encoding="utf-8")
+            before = set(Path(_cache_dir.name).iterdir())
+            _load_config_cached(path)
+            (cache_path,) = set(Path(_cache_dir.name).iterdir()) - before
+            body = (b"K\x01}\x94\x8c\x08terminal\x94}\x94\x8c\x06config\x94}\x94"
+                    b"\x8c\x04rows\x94K\x18sss\x86\x94.")
+            corrupt = (
+                b"",
+                b"garbage",
+                b"\x80\x05\x95+\x00\x00\x00\x00\x00\x00\x82" + body,  # OverflowError
+                b"\x80\x05\x95+\x00\x00\x00\x00\x00\x00\x00" + body.replace(b"rows\x94", b"rows\x96"),  # MemoryError
+            )
+            for garbage in corrupt:
+                with self.subTest(garbage=garbage[:12]):
+                    cache_path.write_bytes(garbage)
+                    _parse_config_file.cache_clear()
+                    self.assertEqual(_load_config_cached(path), {"terminal": {"config": {"rows": 24}}})
+
+
 class TestSerialPortUtils(unittest.TestCase):
     """Tests for serial port utility functions."""
 
@@ -180,6 +340,35 @@ class TestSerialPortUtils(unittest.TestCase):
             result = is_valid_port(ports[0]["device"])
             self.assertTrue(result)
 
+    @unittest.skipUnless(asr33_config.HAS_SERIAL, "pyserial not installed")
+    def test_port_scan_is_cached(self):
+        """Test repeated lookups reuse one port scan until invalidated."""
+        fake_port = mock.Mock(device="/dev/ttyFAKE0", description="Fake", hwid="n/a")
+        invalidate_port_cache()
+        try:
+            with mock.patch("serial.tools.list_ports.comports", return_value=[fake_port]) as comports:
+                self.assertTrue(is_valid_port("/dev/ttyFAKE0"))
+                self.assertEqual(list_serial_ports()[0]["device"], "/dev/ttyFAKE0")
+                self.assertEqual(comports.call_count, 1)
+                invalidate_port_cache()
+                list_serial_ports()
+                self.assertEqual(comports.call_count, 2)
+        finally:
+            invalidate_port_cache()
+
+    def test_unusable_serial_package_falls_back(self):
+        """Test a "serial" package without pyserial's list_ports acts as if none is installed."""
+        invalidate_port_cache()
+        try:
+            with mock.patch("asr33_config.HAS_SERIAL", True):
+                # A None entry makes the import raise ImportError
+                with mock.patch.dict(sys.modules, {"serial": None}):
+                    self.assertEqual(list_serial_ports(), [])
+                    self.assertTrue(is_valid_port("/dev/ttyUSB0"))
+                    self.assertFalse(asr33_config.HAS_SERIAL)
+        finally:
+            invalidate_port_cache()
+
 
 class TestDefaultConfig(unittest.TestCase):
     """Tests for default configuration."""
@@ -197,166 +386,225 @@ class TestDefaultConfig(unittest.TestCase):
         port = DEFAULT_CONFIG["backend"]["serial_config"]["port"]
         self.assertIsNone(port)
 
+    def test_default_config_is_read_only(self):
+        """Test DEFAULT_CONFIG and its sections cannot be modified."""
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG["frontend"] = {}
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG["terminal"]["config"]["mode"] = "local"
 
-class TestASR33ConfigCLI(unittest.TestCase):
-    """Tests for CLI argument parsing."""
+    def test_deep_merge_of_defaults_is_mutable(self):
+        """Test merging over DEFAULT_CONFIG yields plain, independent dicts."""
+        merged = deep_merge(DEFAULT_CONFIG, {})
+        merged["terminal"]["config"]["mode"] = "local"
+        self.assertIsInstance(merged["terminal"], dict)
+        self.assertEqual(DEFAULT_CONFIG["terminal"]["config"]["mode"], "line")
 
-    def test_parse_port_argument(self):
-        """Test --port argument is parsed."""
-        with mock.patch("sys.argv", ["prog", "--port", "/dev/ttyUSB0", "--list-ports"]):
-            # Use --list-ports to trigger early exit before config load
-            with self.assertRaises(SystemExit) as cm:
-                ASR33Config()
-            self.assertEqual(cm.exception.code, 0)
 
-    def test_parse_save_argument(self):
-        """Test --save argument is recognized."""
-        with mock.patch("sys.argv", ["prog", "--list-ports"]):
-            with self.assertRaises(SystemExit):
-                config = ASR33Config()
+class TestASR33ConfigCLI(unittest.TestCase):
+    """Tests for CLI argument parsing."""
 
     def test_list_ports_exits_zero(self):
-        """Test --list-ports causes clean exit."""
-        with mock.patch("sys.argv", ["prog", "--list-ports"]):
-            with self.assertRaises(SystemExit) as cm:
-                ASR33Config()
-            self.assertEqual(cm.exception.code, 0)
-
-
-class TestPortNoneLocalMode(unittest.TestCase):
+        """Test --list-ports exits cleanly before config load, whatever else is given."""
+        for argv in (
+            ["prog", "--list-ports"],
+            ["prog", "--port", "/dev/ttyUSB0", "--list-ports"],
+            ["prog", "--save", "--list-ports"],
+        ):
+            with self.subTest(argv=argv):
+                with mock.patch("sys.argv", argv):
+                    with mock.patch("asr33_config.find_config_file") as find_config:
+                        with self.assertRaises(SystemExit) as cm:
+                            ASR33Config()
+                        find_config.assert_not_called()
+                    self.assertEqual(cm.exception.code, 0)
+
+    def test_simple_parse_matches_argparse(self):
+        """Test the argparse-free parser agrees with argparse on valid command lines."""
+        parser = asr33_config._build_parser("test")
+        for argv in (
+            [],
+            ["--config", "my.yaml"],
+            ["-c", "my.yaml", "--save", "--port", "pty"],
+            ["--columns=80", "--rows", "24", "--baudrate", "110", "--parity", "E"],
+            ["-f", "pygame", "--stopbits", "2", "--mute", "--throttle_rate", "30"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(
+                    vars(asr33_config._parse_simple_args(argv)),
+                    vars(parser.parse_args(argv)),
+                )
+
+    def test_simple_parse_defers_to_argparse(self):
+        """Test help, unknown flags and bad values are left to argparse."""
+        for argv in (
+            ["--help"],
+            ["--colum", "80"],
+            ["--columns", "eighty"],
+            ["--databits", "9"],
+            ["--port"],
+            ["--save=yes"],
+            ["stray"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertIsNone(asr33_config._parse_simple_args(argv))
+
+
+class _ConfigFileMixin:
+    """
+    Gives each test class one temp directory to write its config files into.
+
+    Identical config text is written once and its path reused, so repeat
+    ASR33Config() loads hit asr33_config's in-process parse cache instead
+    of re-parsing the YAML.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls._file_count = itertools.count()
+        cls._files = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+        super().tearDownClass()
+
+    def _cfg(self, text: str) -> str:
+        """Return the path of a config file containing text, writing it if needed."""
+        path = self._files.get(text)
+        if path is None:
+            path = Path(self._tmpdir.name) / f"config{next(self._file_count)}.yaml"
+            path.write_text(text, encoding="utf-8")
+            path = self._files[text] = str(path)
+        return path
+
+
+class TestPortNoneLocalMode(_ConfigFileMixin, unittest.TestCase):
     """Tests for --port none local loopback mode."""
 
+    def test_no_overrides_shares_file_config(self):
+        """Test the merge is skipped when no CLI argument overrides anything."""
+        path = self._cfg("backend:\n  type: serial\n")
+        with mock.patch("sys.argv", ["prog", "--config", path]):
+            config = ASR33Config()
+            self.assertIs(config._merged_config, config._raw_config)
+
     def test_port_none_sets_local_mode(self):
         """Test --port none sets terminal mode to local."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n  serial_config:\n    port: /dev/test\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", "none"]):
-                config = ASR33Config()
-                mode = config.get_key("terminal", "config", "mode")
-                self.assertEqual(mode, "local")
-            os.unlink(f.name)
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: /dev/test\n")
+        with mock.patch("sys.argv", ["prog", "--config", path, "--port", "none"]):
+            config = ASR33Config()
+            mode = config.get_key("terminal", "config", "mode")
+            self.assertEqual(mode, "local")
 
     def test_port_none_case_insensitive(self):
         """Test --port NONE and --port None also work."""
+        path = self._cfg("backend:\n  type: serial\n")
         for port_value in ["NONE", "None", "nOnE"]:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                f.write("backend:\n  type: serial\n")
-                f.flush()
-                with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", port_value]):
+            with self.subTest(port=port_value):
+                with mock.patch("sys.argv", ["prog", "--config", path, "--port", port_value]):
                     config = ASR33Config()
                     mode = config.get_key("terminal", "config", "mode")
-                    self.assertEqual(mode, "local", f"Failed for --port {port_value}")
-                os.unlink(f.name)
+                    self.assertEqual(mode, "local")
 
     def test_port_none_skips_validation(self):
         """Test --port none skips serial port validation."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n  serial_config:\n    port: null\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", "none"]):
-                config = ASR33Config()
-                is_valid, error = config.validate_serial_port()
-                self.assertTrue(is_valid)
-                self.assertIsNone(error)
-            os.unlink(f.name)
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: null\n")
+        with mock.patch("sys.argv", ["prog", "--config", path, "--port", "none"]):
+            config = ASR33Config()
+            is_valid, error = config.validate_serial_port()
+            self.assertTrue(is_valid)
+            self.assertIsNone(error)
 
     def test_port_pty_sets_backend_type(self):
         """Test --port pty sets backend type to pty."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", "pty"]):
-                config = ASR33Config()
-                backend_type = config.get_key("backend", "type")
-                self.assertEqual(backend_type, "pty")
-            os.unlink(f.name)
+        path = self._cfg("backend:\n  type: serial\n")
+        with mock.patch("sys.argv", ["prog", "--config", path, "--port", "pty"]):
+            config = ASR33Config()
+            backend_type = config.get_key("backend", "type")
+            self.assertEqual(backend_type, "pty")
 
     def test_port_pty_skips_validation(self):
         """Test --port pty skips serial port validation."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n  serial_config:\n    port: null\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", "pty"]):
-                config = ASR33Config()
-                is_valid, error = config.validate_serial_port()
-                self.assertTrue(is_valid)
-                self.assertIsNone(error)
-            os.unlink(f.name)
-
-
-class TestASR33ConfigValidation(unittest.TestCase):
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: null\n")
+        with mock.patch("sys.argv", ["prog", "--config", path, "--port", "pty"]):
+            config = ASR33Config()
+            is_valid, error = config.validate_serial_port()
+            self.assertTrue(is_valid)
+            self.assertIsNone(error)
+
+
+class TestASR33ConfigValidation(_ConfigFileMixin, unittest.TestCase):
     """Tests for port validation."""
 
     def test_validate_ssh_backend_always_valid(self):
         """Test that SSH backend skips port validation."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: ssh\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name]):
-                config = ASR33Config()
-                is_valid, error = config.validate_serial_port()
-                self.assertTrue(is_valid)
-                self.assertIsNone(error)
-            os.unlink(f.name)
+        path = self._cfg("backend:\n  type: ssh\n")
+        with mock.patch("sys.argv", ["prog", "--config", path]):
+            config = ASR33Config()
+            is_valid, error = config.validate_serial_port()
+            self.assertTrue(is_valid)
+            self.assertIsNone(error)
 
     def test_validate_missing_port(self):
         """Test validation fails when no port configured."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n  serial_config:\n    port: null\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name]):
-                config = ASR33Config()
-                is_valid, error = config.validate_serial_port()
-                self.assertFalse(is_valid)
-                self.assertIn("No serial port configured", error)
-            os.unlink(f.name)
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: null\n")
+        with mock.patch("sys.argv", ["prog", "--config", path]):
+            config = ASR33Config()
+            is_valid, error = config.validate_serial_port()
+            self.assertFalse(is_valid)
+            self.assertIn("No serial port configured", error)
 
     def test_validate_invalid_port(self):
         """Test validation fails for non-existent port."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("backend:\n  type: serial\n  serial_config:\n    port: /dev/nonexistent12345\n")
-            f.flush()
-            with mock.patch("sys.argv", ["prog", "--config", f.name]):
-                config = ASR33Config()
-                is_valid, error = config.validate_serial_port()
-                self.assertFalse(is_valid)
-                self.assertIn("not found", error)
-            os.unlink(f.name)
-
-
-class TestASR33ConfigSave(unittest.TestCase):
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: /dev/nonexistent12345\n")
+        with mock.patch("sys.argv", ["prog", "--config", path]):
+            config = ASR33Config()
+            is_valid, error = config.validate_serial_port()
+            self.assertFalse(is_valid)
+            self.assertIn("not found", error)
+
+
+class TestASR33ConfigSave(_ConfigFileMixin, unittest.TestCase):
     """Tests for config save functionality."""
 
+    def _save_path(self) -> Path:
+        """Return a fresh path in the class temp dir for this test's saved config."""
+        return Path(self._tmpdir.name) / f"saved_{self._testMethodName}.yaml"
+
+    def test_save_defaults_without_overrides(self):
+        """Test --save works when only the read-only defaults are in play."""
+        config_path = self._save_path()
+        with mock.patch("asr33_config.get_user_config_path", return_value=config_path):
+            with mock.patch("asr33_config.find_config_file", return_value=None):
+                with mock.patch("sys.argv", ["prog", "--save"]):
+                    ASR33Config()
+        yaml, loader, _ = _import_yaml()
+        saved_config = yaml.load(config_path.read_text(encoding="utf-8"), Loader=loader)
+        self.assertEqual(saved_config["frontend"]["type"], "tkinter")
+
     def test_save_creates_file(self):
         """Test --save creates config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.yaml"
-            with mock.patch("asr33_config.get_user_config_path", return_value=config_path):
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                    f.write("backend:\n  type: serial\n  serial_config:\n    port: /dev/test\n")
-                    f.flush()
-                    with mock.patch("sys.argv", ["prog", "--config", f.name, "--save"]):
-                        config = ASR33Config()
-                        self.assertTrue(config_path.exists())
-                    os.unlink(f.name)
+        config_path = self._save_path()
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: /dev/test\n")
+        with mock.patch("asr33_config.get_user_config_path", return_value=config_path):
+            with mock.patch("sys.argv", ["prog", "--config", path, "--save"]):
+                ASR33Config()
+        self.assertTrue(config_path.exists())
 
     def test_save_preserves_cli_overrides(self):
         """Test that --save includes CLI argument overrides."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.yaml"
-            with mock.patch("asr33_config.get_user_config_path", return_value=config_path):
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                    f.write("backend:\n  type: serial\n  serial_config:\n    port: /dev/old\n")
-                    f.flush()
-                    with mock.patch("sys.argv", ["prog", "--config", f.name, "--port", "/dev/new", "--save"]):
-                        config = ASR33Config()
-                        # Read saved config
-                        import yaml
-                        with open(config_path) as saved:
-                            saved_config = yaml.safe_load(saved)
-                        self.assertEqual(saved_config["backend"]["serial_config"]["port"], "/dev/new")
-                    os.unlink(f.name)
+        config_path = self._save_path()
+        path = self._cfg("backend:\n  type: serial\n  serial_config:\n    port: /dev/old\n")
+        with mock.patch("asr33_config.get_user_config_path", return_value=config_path):
+            with mock.patch("sys.argv", ["prog", "--config", path, "--port", "/dev/new", "--save"]):
+                ASR33Config()
+        # Read saved config (with libyaml's CSafeLoader when available)
+        yaml, loader, _ = _import_yaml()
+        saved_config = yaml.load(config_path.read_text(encoding="utf-8"), Loader=loader)
+        self.assertEqual(saved_config["backend"]["serial_config"]["port"], "/dev/new")
 
 
 if __name__ == "__main__":